@@ -1,18 +1,55 @@
 """Command Line Interface entry point using Typer."""
 
+import functools
 import sys
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional
 import typer
-from photo_meta_organizer.config import load_config
 
 # Create Typer app
+# Plain Click formatting keeps --help and usage errors from importing Rich,
+# which otherwise costs more than importing Typer itself.
 app = typer.Typer(
     help="Photo Meta Organizer - Organize by time, fix metadata, batch rename",
     add_completion=False,
+    rich_markup_mode=None,
+    pretty_exceptions_enable=False,
 )
 
 
-@app.command()
+@app.callback()
+def _root() -> None:
+    # An explicit callback keeps Typer in multi-command mode even when only the
+    # invoked subcommand has been registered (see main()).
+    pass
+
+
+def _handle_cli_errors(func: Callable[..., None]) -> Callable[..., None]:
+    """Reports command failures uniformly and exits with a non-zero code.
+
+    The traceback is only printed when the command was run with --verbose.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> None:
+        try:
+            func(*args, **kwargs)
+        except typer.Exit:
+            raise
+        except FileNotFoundError as e:
+            typer.echo(f"❌ Error: {e}", err=True)
+            raise typer.Exit(code=1)
+        except Exception as e:
+            typer.echo(f"❌ Execution failed: {e}", err=True)
+            if kwargs.get("verbose"):
+                import traceback
+
+                traceback.print_exc()
+            raise typer.Exit(code=1)
+
+    return wrapper
+
+
+@_handle_cli_errors
 def organize(
     config_path: Optional[str] = typer.Option(
         None, "--config", "-c", help="Path to configuration file"
@@ -23,32 +60,21 @@ def organize(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show verbose logs"),
 ) -> None:
     """Organize photos into target directory based on metadata."""
+    from photo_meta_organizer.config import load_config
     from photo_meta_organizer.services.organize_photos import (
         organize as service_organize,
     )
 
-    try:
-        config = load_config(config_path)
-        result = service_organize(config=config, dry_run=dry_run, verbose=verbose)
+    config = load_config(config_path)
+    result = service_organize(config=config, dry_run=dry_run, verbose=verbose)
 
-        if result["success"] > 0:
-            typer.echo(f"\n✅ Successfully processed {result['success']} files")
-        if result.get("errors"):
-            typer.echo(f"❌ Failed {len(result['errors'])} files")
+    if result["success"] > 0:
+        typer.echo(f"\n✅ Successfully processed {result['success']} files")
+    if result.get("errors"):
+        typer.echo(f"❌ Failed {len(result['errors'])} files")
 
-    except FileNotFoundError as e:
-        typer.echo(f"❌ Error: {e}", err=True)
-        raise typer.Exit(code=1)
-    except Exception as e:
-        typer.echo(f"❌ Execution failed: {e}", err=True)
-        if verbose:
-            import traceback
 
-            traceback.print_exc()
-        raise typer.Exit(code=1)
-
-
-@app.command()
+@_handle_cli_errors
 def fix(
     source: Optional[str] = typer.Option(
         None, "--source", "-s", help="Directory to fix (overrides fix_dir in config)"
@@ -62,32 +88,21 @@ def fix(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show verbose logs"),
 ) -> None:
     """Fix photo metadata based on directory names."""
+    from photo_meta_organizer.config import load_config
     from photo_meta_organizer.services.fix_metadata import run_fix
 
-    try:
-        config = load_config(config_path)
-        # Override config if source is specified
-        if source:
-            config["directories"]["fix_dir"] = source
-
-        result = run_fix(config=config, dry_run=dry_run)
-
-        if result["success"] > 0:
-            typer.echo(f"\n✅ Successfully fixed {result['success']} files")
+    config = load_config(config_path)
+    # Override config if source is specified
+    if source:
+        config["directories"]["fix_dir"] = source
 
-    except FileNotFoundError as e:
-        typer.echo(f"❌ Error: {e}", err=True)
-        raise typer.Exit(code=1)
-    except Exception as e:
-        typer.echo(f"❌ Execution failed: {e}", err=True)
-        if verbose:
-            import traceback
+    result = run_fix(config=config, dry_run=dry_run, verbose=verbose)
 
-            traceback.print_exc()
-        raise typer.Exit(code=1)
+    if result["success"] > 0:
+        typer.echo(f"\n✅ Successfully fixed {result['success']} files")
 
 
-@app.command()
+@_handle_cli_errors
 def rename(
     target: Optional[str] = typer.Option(
         None,
@@ -104,32 +119,21 @@ def rename(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show verbose logs"),
 ) -> None:
     """Batch rename photos to YYYYMMDD_HHMMSS_OriginalName.ext format."""
+    from photo_meta_organizer.config import load_config
     from photo_meta_organizer.services.rename_photos import rename_process
 
-    try:
-        config = load_config(config_path)
-        # Override config if target is specified
-        if target:
-            config["directories"]["target_dir"] = target
-
-        result = rename_process(config=config, dry_run=dry_run, verbose=verbose)
-
-        if result["success"] > 0:
-            typer.echo(f"\n✅ Scheduled to rename {result['success']} files")
+    config = load_config(config_path)
+    # Override config if target is specified
+    if target:
+        config["directories"]["target_dir"] = target
 
-    except FileNotFoundError as e:
-        typer.echo(f"❌ Error: {e}", err=True)
-        raise typer.Exit(code=1)
-    except Exception as e:
-        typer.echo(f"❌ Execution failed: {e}", err=True)
-        if verbose:
-            import traceback
+    result = rename_process(config=config, dry_run=dry_run, verbose=verbose)
 
-            traceback.print_exc()
-        raise typer.Exit(code=1)
+    if result["success"] > 0:
+        typer.echo(f"\n✅ Scheduled to rename {result['success']} files")
 
 
-@app.command()
+@_handle_cli_errors
 def clean_junk(
     threshold: Optional[float] = typer.Option(
         None, "--threshold", help="Size threshold in MB (default: use config value)"
@@ -143,61 +147,65 @@ def clean_junk(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show verbose logs"),
 ) -> None:
     """Clean small files by moving them to junk directory."""
+    from photo_meta_organizer.config import load_config
     from photo_meta_organizer.services.junk_finder import clean_small_files_recursive
 
-    try:
-        config = load_config(config_path)
-        # Override config if threshold is specified
-        if threshold is not None:
-            config["settings"]["size_threshold_mb"] = threshold
+    config = load_config(config_path)
+    # Override config if threshold is specified
+    if threshold is not None:
+        config["settings"]["size_threshold_mb"] = threshold
 
-        result = clean_small_files_recursive(
-            config=config, dry_run=dry_run, verbose=verbose
-        )
+    result = clean_small_files_recursive(
+        config=config, dry_run=dry_run, verbose=verbose
+    )
 
-        if result["found"] > 0:
-            typer.echo(f"\n✅ Found {result['found']} small files")
+    if result["found"] > 0:
+        typer.echo(f"\n✅ Found {result['found']} small files")
 
-    except FileNotFoundError as e:
-        typer.echo(f"❌ Error: {e}", err=True)
-        raise typer.Exit(code=1)
-    except Exception as e:
-        typer.echo(f"❌ Execution failed: {e}", err=True)
-        if verbose:
-            import traceback
 
-            traceback.print_exc()
-        raise typer.Exit(code=1)
+TASK_NAMES = ("organize", "fix", "rename", "clean-junk")
 
 
-@app.command()
-def run_task(
-    params_file: str = typer.Argument(..., help="Path to the JSON parameters file"),
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show verbose logs"),
-) -> None:
-    """Execute a task defined in a JSON file."""
-    import json
-    from pathlib import Path
+def expand_task_params(params: Any) -> List[Dict[str, Any]]:
+    """Expands a params file into the list of tasks it describes.
 
-    p_file = Path(params_file)
-    if not p_file.exists():
-        typer.echo(f"❌ Error: Parameters file not found: {p_file}", err=True)
-        raise typer.Exit(code=1)
+    Accepted layouts:
+    1. A single task object: {"task": "organize", ...}
+    2. A list of task objects: [{"task": "organize", ...}, {"task": "fix", ...}]
+    3. A batch object: {"dry_run": true, "tasks": [...]}, where top-level keys
+       are shared defaults that each task may override.
 
-    try:
-        with open(p_file, "r", encoding="utf-8") as f:
-            params = json.load(f)
-    except json.JSONDecodeError as e:
-        typer.echo(f"❌ Error parsing JSON: {e}", err=True)
-        raise typer.Exit(code=1)
+    Args:
+        params: The parsed JSON document.
 
-    task_name = params.get("task")
-    if not task_name:
-        typer.echo("❌ Error: 'task' field missing in JSON", err=True)
-        raise typer.Exit(code=1)
+    Returns:
+        List[Dict[str, Any]]: Task parameter dictionaries in execution order.
+    """
+    if isinstance(params, list):
+        return params
+    if isinstance(params, dict) and "tasks" in params:
+        shared = {key: value for key, value in params.items() if key != "tasks"}
+        return [{**shared, **task} for task in params["tasks"]]
+    return [params]
+
+
+def execute_task(
+    params: Dict[str, Any], base_config: Dict[str, Any], verbose: bool
+) -> Any:
+    """Runs a single JSON-defined task against a copy of the base config.
 
-    # Load base config
-    config = load_config()
+    Args:
+        params: Parameters of one task, including its "task" name.
+        base_config: Configuration loaded once for the whole run.
+        verbose: If True, print detailed logs.
+
+    Returns:
+        Any: The result returned by the task's service.
+    """
+    import copy
+
+    task_name = params["task"]
+    config = copy.deepcopy(base_config)
 
     # Ensure structure exists
     config.setdefault("directories", {})
@@ -223,9 +231,9 @@ def run_task(
         # Ensure settings exist for service consumption
         config.setdefault("settings", {})["dry_run"] = dry_run
 
-        result = service_organize(config=config, dry_run=dry_run, verbose=verbose)
+        return service_organize(config=config, dry_run=dry_run, verbose=verbose)
 
-    elif task_name == "fix":
+    if task_name == "fix":
         from photo_meta_organizer.services.fix_metadata import run_fix
 
         if input_dirs:
@@ -233,9 +241,9 @@ def run_task(
 
         config.setdefault("settings", {})["dry_run"] = dry_run
 
-        result = run_fix(config=config, dry_run=dry_run)
+        return run_fix(config=config, dry_run=dry_run, verbose=verbose)
 
-    elif task_name == "rename":
+    if task_name == "rename":
         from photo_meta_organizer.services.rename_photos import rename_process
 
         if input_dirs:
@@ -243,9 +251,9 @@ def run_task(
 
         config.setdefault("settings", {})["dry_run"] = dry_run
 
-        result = rename_process(config=config, dry_run=dry_run, verbose=verbose)
+        return rename_process(config=config, dry_run=dry_run, verbose=verbose)
 
-    elif task_name == "clean-junk":
+    if task_name == "clean-junk":
         from photo_meta_organizer.services.junk_finder import (
             clean_small_files_recursive,
         )
@@ -265,24 +273,112 @@ def run_task(
         config.setdefault("settings", {})["size_threshold_mb"] = float(threshold)
         config.setdefault("settings", {})["dry_run"] = dry_run
 
-        result = clean_small_files_recursive(
+        return clean_small_files_recursive(
             config=config, dry_run=dry_run, verbose=verbose
         )
 
-    else:
-        typer.echo(f"❌ Error: Unknown task '{task_name}'", err=True)
+    raise ValueError(f"Unknown task '{task_name}'")
+
+
+@_handle_cli_errors
+def run_task(
+    params_file: str = typer.Argument(..., help="Path to the JSON parameters file"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show verbose logs"),
+) -> None:
+    """Execute a task (or a batch of tasks) defined in a JSON file."""
+    import json
+    from pathlib import Path
+    from photo_meta_organizer.config import load_config
+
+    p_file = Path(params_file)
+    if not p_file.exists():
+        typer.echo(f"❌ Error: Parameters file not found: {p_file}", err=True)
+        raise typer.Exit(code=1)
+
+    try:
+        with open(p_file, "r", encoding="utf-8") as f:
+            params = json.load(f)
+    except json.JSONDecodeError as e:
+        typer.echo(f"❌ Error parsing JSON: {e}", err=True)
         raise typer.Exit(code=1)
 
-    # Output results (Unified simple reporting)
-    if isinstance(result, dict):
-        if result.get("success", 0) > 0 or result.get("found", 0) > 0:
-            typer.echo(f"\n✅ Task '{task_name}' completed successfully.")
-        else:
-            typer.echo(f"\n⚠️ Task '{task_name}' completed but processed 0 files.")
+    tasks = expand_task_params(params)
+    if not tasks:
+        typer.echo("❌ Error: No tasks defined in JSON", err=True)
+        raise typer.Exit(code=1)
+
+    # Validate every task up front so a batch never stops halfway on a typo
+    for task_params in tasks:
+        task_name = task_params.get("task") if isinstance(task_params, dict) else None
+        if not task_name:
+            typer.echo("❌ Error: 'task' field missing in JSON", err=True)
+            raise typer.Exit(code=1)
+        if task_name not in TASK_NAMES:
+            typer.echo(f"❌ Error: Unknown task '{task_name}'", err=True)
+            raise typer.Exit(code=1)
+
+    # Load base config once; every task works on its own copy
+    base_config = load_config()
+    is_batch = len(tasks) > 1
+
+    for index, task_params in enumerate(tasks, start=1):
+        task_name = task_params["task"]
+        if is_batch:
+            typer.echo(f"\n▶️ [{index}/{len(tasks)}] Task '{task_name}'")
+
+        result = execute_task(task_params, base_config, verbose)
+
+        # Output results (Unified simple reporting)
+        if isinstance(result, dict):
+            if result.get("success", 0) > 0 or result.get("found", 0) > 0:
+                typer.echo(f"\n✅ Task '{task_name}' completed successfully.")
+            else:
+                typer.echo(f"\n⚠️ Task '{task_name}' completed but processed 0 files.")
+
+
+COMMANDS = {
+    "organize": organize,
+    "fix": fix,
+    "rename": rename,
+    "clean-junk": clean_junk,
+    "run-task": run_task,
+}
+
+
+def register_commands(app: typer.Typer, names: Optional[List[str]] = None) -> None:
+    """Registers CLI commands on the Typer app.
+
+    Args:
+        app: The Typer application.
+        names: Command names to register. Registers all commands when None.
+    """
+    registered = {info.name for info in app.registered_commands}
+    for name in names or COMMANDS:
+        if name not in registered:
+            app.command(name)(COMMANDS[name])
+
+
+def sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Detects the invoked subcommand from raw arguments.
+
+    Args:
+        argv: Command line arguments without the program name.
+
+    Returns:
+        Optional[str]: The subcommand name, or None when it cannot be determined
+        (e.g. top-level --help), in which case every command must be registered.
+    """
+    if argv and argv[0] in COMMANDS:
+        return argv[0]
+    return None
 
 
 def main() -> None:
     """CLI Main Entry Point."""
+    # Typer introspects every registered command when building the Click group,
+    # so only the invoked one is registered when it can be identified up front.
+    command = sniff_subcommand(sys.argv[1:])
+    register_commands(app, [command] if command else None)
     app()
 
 
@@ -1,11 +1,13 @@
 """Configuration management module."""
 
+import json
 import os
+from functools import cache
 from pathlib import Path
-from typing import Dict, Any, Optional, Set
-import yaml
+from typing import Dict, Any, FrozenSet, Optional
 
 
+@cache
 def get_project_root() -> Path:
     """Gets the project root directory.
 
@@ -21,9 +23,79 @@ def get_project_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+def _read_config_cache(
+    cache_path: Path, source_mtime_ns: int, source_size: int
+) -> Optional[Dict[str, Any]]:
+    """Reads the parsed config from its JSON sidecar if it is still fresh.
+
+    Args:
+        cache_path: Path to the JSON sidecar.
+        source_mtime_ns: Modification time of the YAML file the cache must match.
+        source_size: Size of the YAML file the cache must match. Catches edits
+            that coarse timestamps (FAT, HFS+) leave with the same mtime.
+
+    Returns:
+        Optional[Dict[str, Any]]: The cached configuration, or None on a miss.
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(cached, dict)
+        or cached.get("source_mtime_ns") != source_mtime_ns
+        or cached.get("source_size") != source_size
+    ):
+        return None
+    return cached.get("config")
+
+
+def _write_config_cache(
+    cache_path: Path, source_mtime_ns: int, source_size: int, config: Dict[str, Any]
+) -> None:
+    """Atomically writes the parsed config to its JSON sidecar.
+
+    The cache is an optimization only, so any failure leaves it absent. Configs
+    that JSON cannot reproduce exactly (e.g. mappings with non-string keys
+    such as `2023:`) are not cached, so warm runs see the same config as cold
+    runs.
+    """
+    # Only needed on a cache miss, so warm starts skip the import
+    import tempfile
+
+    try:
+        payload = json.dumps(
+            {
+                "source_mtime_ns": source_mtime_ns,
+                "source_size": source_size,
+                "config": config,
+            }
+        )
+        if json.loads(payload)["config"] != config:
+            return
+        fd, tmp_path = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=f".{cache_path.name}.", suffix=".tmp"
+        )
+    except (OSError, TypeError, ValueError):
+        return
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """Loads the configuration file.
 
+    The parsed result is cached in a JSON sidecar (config.yaml.cache.json) keyed
+    by the YAML file's mtime and size, so unchanged configs skip YAML parsing entirely.
+
     Args:
         config_path: Path to the configuration file. If None, looks for
             config.yaml in the project root.
@@ -44,26 +116,42 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
             f"Please copy config.example.yaml to config.yaml and modify it."
         )
 
+    source_stat = config_path_obj.stat()
+    cache_path = config_path_obj.with_name(f"{config_path_obj.name}.cache.json")
+    cached = _read_config_cache(
+        cache_path, source_stat.st_mtime_ns, source_stat.st_size
+    )
+    if cached is not None:
+        return cached
+
+    import yaml
+
     with open(config_path_obj, "r", encoding="utf-8") as f:
         config = yaml.safe_load(f)
 
+    _write_config_cache(
+        cache_path, source_stat.st_mtime_ns, source_stat.st_size, config
+    )
     return config
 
 
-def get_extensions(config: Dict[str, Any]) -> Dict[str, Set[str]]:
+def get_extensions(config: Dict[str, Any]) -> Dict[str, FrozenSet[str]]:
     """Gets the sets of valid file extensions from configuration.
 
+    Extensions are lowercased, matching the lowercased extension the services
+    take from each file name, so a lookup needs no further normalization.
+
     Args:
         config: The configuration dictionary.
 
     Returns:
-        Dict[str, Set[str]]: A dictionary with 'image', 'video', and 'all' keys,
-            each containing a set of extension strings (e.g., '.jpg').
+        Dict[str, FrozenSet[str]]: A dictionary with 'image', 'video', and 'all'
+            keys, each containing a set of extension strings (e.g., '.jpg').
     """
     extensions = config.get("extensions", {})
 
-    image_exts = set(extensions.get("image", []))
-    video_exts = set(extensions.get("video", []))
+    image_exts = frozenset(ext.lower() for ext in extensions.get("image", []))
+    video_exts = frozenset(ext.lower() for ext in extensions.get("video", []))
 
     return {
         "image": image_exts,
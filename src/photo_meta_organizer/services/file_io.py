@@ -0,0 +1,302 @@
+"""Shared filesystem helpers."""
+
+import errno
+import os
+import shutil
+import threading
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Directory listings are latency-bound on network volumes, so many can be in flight.
+SCAN_WORKERS = 16
+
+SCAN_MODES = ("flat", "progressive")
+
+
+def iter_file_entries(root: Path) -> Iterator[os.DirEntry]:
+    """Recursively yields the files below root as os.DirEntry objects.
+
+    Uses os.scandir so file/directory checks come from the directory listing
+    itself instead of one stat call per entry. Directory symlinks are not
+    followed; unreadable directories are skipped.
+
+    Args:
+        root: Directory to walk.
+
+    Yields:
+        os.DirEntry: One entry per regular file (or symlink to one).
+    """
+    pending = [str(root)]
+    while pending:
+        dir_path = pending.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+            except OSError:
+                continue
+
+
+def list_directory(
+    dir_path: str, exclude: Optional[str] = None, follow_symlinks: bool = True
+) -> Tuple[List[os.DirEntry], List[str]]:
+    """Lists a single directory level, warming each file's stat cache.
+
+    Errors are handled per entry, so one unreadable entry never hides the rest
+    of the directory; an unreadable directory yields nothing.
+
+    Args:
+        dir_path: Directory to list.
+        exclude: Directory path that is never descended into.
+        follow_symlinks: Whether symlinks to files count as files.
+
+    Returns:
+        Tuple[List[os.DirEntry], List[str]]: File entries (their stat already
+        cached) and the subdirectories still to be listed.
+    """
+    files: List[os.DirEntry] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(dir_path) as it:
+            entries = list(it)
+    except OSError:
+        return files, subdirs
+
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.path != exclude:
+                    subdirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=follow_symlinks):
+                # DirEntry caches the result, so callers get it without a syscall
+                entry.stat(follow_symlinks=follow_symlinks)
+                files.append(entry)
+        except OSError:
+            continue
+    return files, subdirs
+
+
+def scan_file_entries_parallel(
+    root: Path,
+    max_workers: int = SCAN_WORKERS,
+    exclude: Optional[Path] = None,
+    follow_symlinks: bool = True,
+) -> List[os.DirEntry]:
+    """Lists the files below root, listing directories concurrently.
+
+    Useful on network volumes where every directory listing is a round trip.
+    Each directory is listed on its own task as soon as its parent is done, so
+    deep and unbalanced trees keep all workers busy. Files directly in root
+    come first; the rest follow in completion order.
+
+    Args:
+        root: Directory to walk.
+        max_workers: Number of directories listed at the same time.
+        exclude: Directory that is never descended into.
+        follow_symlinks: Whether symlinks to files are listed as files.
+
+    Returns:
+        List[os.DirEntry]: One entry per file, with its stat already cached.
+    """
+    files: List[os.DirEntry] = []
+    skip = str(exclude) if exclude is not None else None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(list_directory, str(root), skip, follow_symlinks)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                dir_files, subdirs = future.result()
+                files.extend(dir_files)
+                for subdir in subdirs:
+                    pending.add(
+                        executor.submit(list_directory, subdir, skip, follow_symlinks)
+                    )
+    return files
+
+
+def scan_file_entries(root: Path, scan_mode: str = "flat") -> Iterable[os.DirEntry]:
+    """Lists the files below root using the configured scan mode.
+
+    Args:
+        root: Directory to walk.
+        scan_mode: "flat" walks the tree lazily on the calling thread.
+            "progressive" lists every directory as its own task on
+            SCAN_WORKERS threads and returns the whole tree at once, with the
+            files directly in root first (see scan_file_entries_parallel).
+
+    Returns:
+        Iterable[os.DirEntry]: One entry per regular file (or symlink to one).
+
+    Raises:
+        ValueError: If scan_mode is not a known mode.
+    """
+    if scan_mode == "flat":
+        return iter_file_entries(root)
+    if scan_mode == "progressive":
+        return scan_file_entries_parallel(root)
+    raise ValueError(
+        f"Unknown scan_mode '{scan_mode}' (expected one of: {', '.join(SCAN_MODES)})"
+    )
+
+
+def split_extension(name: str) -> str:
+    """Returns the lowercased extension of a file name, like Path.suffix.lower().
+
+    Args:
+        name: Bare file name.
+
+    Returns:
+        str: The extension including the dot, or "" if there is none.
+    """
+    dot = name.rfind(".")
+    if dot <= 0 or dot == len(name) - 1:
+        return ""
+    return name[dot:].lower()
+
+
+def is_same_file(src: str, dst: str, src_stat: Optional[os.stat_result] = None) -> bool:
+    """Checks whether two paths refer to the same file.
+
+    Equal normalized paths answer without any syscall. Otherwise the device and
+    inode are compared, which also covers symlinks, relative vs. absolute paths
+    and case-insensitive file systems.
+
+    Args:
+        src: Path of the source file.
+        dst: Path to compare against.
+        src_stat: Stat of src, if already known.
+
+    Returns:
+        bool: True if both paths name the same existing file.
+    """
+    if os.path.normpath(src) == os.path.normpath(dst):
+        return True
+    try:
+        dst_stat = os.stat(dst)
+        if src_stat is None:
+            src_stat = os.stat(src)
+    except OSError:
+        return False
+    return os.path.samestat(src_stat, dst_stat)
+
+
+def move_file(src: str, dst: str) -> None:
+    """Moves a single file, overwriting dst like shutil.move would.
+
+    Same-filesystem moves are one rename call. Only when the destination is on
+    another filesystem is the file copied (shutil.copy2 uses the kernel copy
+    paths, keeping the modification time) and the source removed.
+
+    Args:
+        src: Path of the file to move.
+        dst: Destination file path (not a directory).
+    """
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copy2(src, dst)
+        os.unlink(src)
+
+
+class FolderIndex:
+    """In-memory set of the file names in one folder.
+
+    The folder is listed once; collision checks then run against the set
+    instead of one stat call per candidate name. Names are compared
+    case-insensitively so that case-insensitive file systems (the macOS
+    default) never get an existing file overwritten. Exact names are kept as
+    well, so releasing one name never frees a case variant that still exists
+    on a case-sensitive file system.
+
+    Callers that share an index between threads hold `lock` around the check
+    and the file operation that follows it. `exists` records whether the folder
+    was found (or has since been created), so it is only created once.
+    """
+
+    def __init__(self, folder: Path) -> None:
+        self.folder = folder
+        self.lock = threading.Lock()
+        try:
+            names = os.listdir(folder)
+            self.exists = True
+        except FileNotFoundError:
+            names = []
+            self.exists = False
+        self._names: Set[str] = set(names)
+        # Number of tracked names per case-folded key
+        self._folded: Dict[str, int] = Counter(name.casefold() for name in self._names)
+
+    def ensure_folder(self) -> None:
+        """Creates the folder (and its parents) unless it is known to exist."""
+        if not self.exists:
+            self.folder.mkdir(parents=True, exist_ok=True)
+            self.exists = True
+
+    def __contains__(self, name: str) -> bool:
+        return self._folded[name.casefold()] > 0
+
+    def reserve(self, name: str) -> Path:
+        """Claims a free name in the folder, appending a counter if needed.
+
+        Format: filename_1.ext, filename_2.ext, etc.
+
+        Args:
+            name: The preferred file name.
+
+        Returns:
+            Path: The claimed path inside the folder.
+        """
+        candidate = name
+        if candidate in self:
+            path = Path(name)
+            counter = 1
+            while True:
+                candidate = f"{path.stem}_{counter}{path.suffix}"
+                if candidate not in self:
+                    break
+                counter += 1
+        self._names.add(candidate)
+        self._folded[candidate.casefold()] += 1
+        return self.folder / candidate
+
+    def release(self, name: str) -> None:
+        """Marks a name as free again, e.g. after its file was moved away.
+
+        The case-folded key only becomes free once no other name maps to it.
+        """
+        if name not in self._names:
+            return
+        self._names.remove(name)
+        key = name.casefold()
+        self._folded[key] -= 1
+        if not self._folded[key]:
+            del self._folded[key]
+
+
+class FolderIndexes:
+    """Builds one FolderIndex per folder on first use. Safe to share between threads."""
+
+    def __init__(self) -> None:
+        self._indexes: Dict[Path, FolderIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(self, folder: Path) -> FolderIndex:
+        """Returns the index of a folder, listing it on first access."""
+        with self._lock:
+            index = self._indexes.get(folder)
+            if index is None:
+                index = self._indexes[folder] = FolderIndex(folder)
+            return index
@@ -2,20 +2,33 @@ import os
 import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from functools import partial
 from pathlib import Path
-from typing import Callable, Dict, Any, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
-import piexif
 from PIL import Image
 
-from photo_meta_organizer.services.image_io import register_heif_support
+from photo_meta_organizer.services.image_io import (
+    EXIF_DATETIME,
+    EXIF_DATETIME_DIGITIZED,
+    EXIF_DATETIME_ORIGINAL,
+    lazy_import,
+    read_jpeg_exif_dates,
+    register_heif_support,
+)
+from photo_meta_organizer.services.output import BufferedPrinter
 
 
 register_heif_support()
 
+# Only JPEG fixes need piexif, so other runs never pay for importing it
+piexif = lazy_import("piexif")
+
+FOLDER_DATE_PATTERN = re.compile(r"(\d{4})[-.\s]+(\d{1,2})")
+
 
 @dataclass(frozen=True)
 class FixTimestamp:
@@ -28,10 +41,13 @@ class FixTimestamp:
 
 
 MetadataWriter = Callable[[Path, FixTimestamp], None]
+MetadataChecker = Callable[[Path, FixTimestamp], bool]
 
 
-def parse_date_from_path(file_path: Path) -> Tuple[Optional[int], Optional[int]]:
-    """Parses year and month from the file path structure.
+def parse_date_from_names(
+    parent: str, grandparent: str
+) -> Tuple[Optional[int], Optional[int]]:
+    """Parses year and month from the names of the enclosing folders.
 
     Strategies:
     1. Parent name contains "YYYY-MM" or "YYYY MM" (e.g. "2023-5", "2023 05")
@@ -39,16 +55,14 @@ def parse_date_from_path(file_path: Path) -> Tuple[Optional[int], Optional[int]]
     3. Parent is "MM" and Grandparent is "YYYY" (e.g. "2000/2")
 
     Args:
-        file_path: Path to the file.
+        parent: Name of the folder containing the file.
+        grandparent: Name of the folder above it.
 
     Returns:
         Tuple[Optional[int], Optional[int]]: A tuple of (year, month) if found, else (None, None).
     """
-    parent = file_path.parent.name
-    grandparent = file_path.parent.parent.name
-
     # Strategy 1: Strong pattern "2023-5" / "2023 05"
-    match = re.search(r"(\d{4})[-.\s]+(\d{1,2})", parent)
+    match = FOLDER_DATE_PATTERN.search(parent)
     if match:
         return int(match.group(1)), int(match.group(2))
 
@@ -64,6 +78,40 @@ def parse_date_from_path(file_path: Path) -> Tuple[Optional[int], Optional[int]]
     return None, None
 
 
+def parse_date_from_dirpath(dirpath: str) -> Tuple[Optional[int], Optional[int]]:
+    """Parses year and month from a directory path string.
+
+    Args:
+        dirpath: Path of the directory containing the files, as a string.
+
+    Returns:
+        Tuple[Optional[int], Optional[int]]: A tuple of (year, month) if found, else (None, None).
+    """
+    # Plain string slicing avoids building Path objects for every lookup
+    head, _, parent = dirpath.rstrip(os.sep).rpartition(os.sep)
+    grandparent = head.rpartition(os.sep)[2]
+    return parse_date_from_names(parent, grandparent)
+
+
+def parse_date_from_path(file_path: Path) -> Tuple[Optional[int], Optional[int]]:
+    """Parses year and month from the folders containing the file.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        Tuple[Optional[int], Optional[int]]: A tuple of (year, month) if found, else (None, None).
+    """
+    return parse_date_from_dirpath(str(file_path.parent))
+
+
+def is_valid_fix_date(year: Optional[int], month: Optional[int]) -> bool:
+    """Checks that a parsed folder date is plausible enough to write."""
+    if not year or not month:
+        return False
+    return 1900 < year < 2030 and 1 <= month <= 12
+
+
 def build_fix_timestamp(year: int, month: int) -> FixTimestamp:
     """Builds the canonical timestamp payload for fix operations.
 
@@ -101,6 +149,43 @@ def write_jpeg_metadata(file_path: Path, payload: FixTimestamp) -> None:
     piexif.insert(exif_bytes, str(file_path))
 
 
+def jpeg_metadata_matches(file_path: Path, payload: FixTimestamp) -> bool:
+    """Checks whether a JPEG already carries the target dates and mtime.
+
+    The mtime is compared first so unfixed files never pay for an EXIF read.
+    The dates come from a direct APP1 scan; piexif is only used when that scan
+    cannot parse the file.
+    """
+    if file_path.stat().st_mtime != payload.unix_ts:
+        return False
+
+    dates = read_jpeg_exif_dates(file_path)
+    if dates is None:
+        try:
+            exif_dict = piexif.load(str(file_path))
+        except Exception:
+            return False
+        dates = {
+            EXIF_DATETIME: exif_dict.get("0th", {}).get(piexif.ImageIFD.DateTime),
+            EXIF_DATETIME_ORIGINAL: exif_dict.get("Exif", {}).get(
+                piexif.ExifIFD.DateTimeOriginal
+            ),
+            EXIF_DATETIME_DIGITIZED: exif_dict.get("Exif", {}).get(
+                piexif.ExifIFD.DateTimeDigitized
+            ),
+        }
+        dates = {
+            tag: value.decode("ascii", errors="replace")
+            for tag, value in dates.items()
+            if isinstance(value, bytes)
+        }
+
+    return all(
+        dates.get(tag) == payload.exif_value
+        for tag in (EXIF_DATETIME, EXIF_DATETIME_ORIGINAL, EXIF_DATETIME_DIGITIZED)
+    )
+
+
 def write_reencoded_image_metadata(
     file_path: Path,
     payload: FixTimestamp,
@@ -191,6 +276,14 @@ FIX_WRITERS = {
     ".mov": ("Video creation_time", "iso_value", write_video_metadata),
 }
 
+FIX_EXTENSIONS = frozenset(FIX_WRITERS)
+
+# Optional idempotency checks that let re-runs skip rewriting unchanged files
+FIX_CHECKERS = {
+    ".jpg": jpeg_metadata_matches,
+    ".jpeg": jpeg_metadata_matches,
+}
+
 
 def apply_metadata_fix(
     file_path: Path,
@@ -199,6 +292,8 @@ def apply_metadata_fix(
     metadata_label: str,
     metadata_value: str,
     writer: MetadataWriter,
+    is_current: Optional[MetadataChecker] = None,
+    printer: Optional[BufferedPrinter] = None,
 ) -> bool:
     """Applies a metadata writer and synchronizes filesystem timestamps.
 
@@ -209,43 +304,72 @@ def apply_metadata_fix(
         metadata_label: User-facing metadata label for logs.
         metadata_value: User-facing metadata value for logs.
         writer: Format-specific metadata writer.
+        is_current: Optional check that returns True when the file is already
+            fixed, in which case nothing is rewritten.
+        printer: Shared output buffer. Lines are printed immediately if omitted.
 
     Returns:
         bool: True if successful, False otherwise.
     """
+    printer = printer or BufferedPrinter(immediate=True)
+
+    try:
+        already_fixed = is_current is not None and is_current(file_path, payload)
+    except OSError:
+        already_fixed = False
+
+    if already_fixed:
+        printer.print(f"⏩ [Skip] Already fixed: {file_path.name}")
+        return True
+
     if dry_run:
-        print(f"[Dry Run] {file_path.name}")
-        print(f"      -> {metadata_label}: {metadata_value}")
-        print(f"      -> System ModTime: {payload.datetime_value}")
+        printer.print(
+            f"[Dry Run] {file_path.name}",
+            f"      -> {metadata_label}: {metadata_value}",
+            f"      -> System ModTime: {payload.datetime_value}",
+        )
         return True
 
     try:
         writer(file_path, payload)
         os.utime(str(file_path), (payload.unix_ts, payload.unix_ts))
-        print(f"✅ [Success] {file_path.name} -> {metadata_value}")
+        printer.print(f"✅ [Success] {file_path.name} -> {metadata_value}")
         return True
 
     except subprocess.CalledProcessError as e:
         error_msg = e.stderr.strip() or e.stdout.strip() or str(e)
-        print(f"❌ [Failed] {file_path.name}: {error_msg}")
+        printer.print(f"❌ [Failed] {file_path.name}: {error_msg}", flush=True)
         return False
     except Exception as e:
-        print(f"❌ [Failed] {file_path.name}: {e}")
+        printer.print(f"❌ [Failed] {file_path.name}: {e}", flush=True)
         return False
 
 
-def process_fix_file(file_path: Path, dry_run: bool) -> bool:
-    """Processes a single file if it matches a supported fix strategy."""
+def process_fix_file(
+    file_path: Path,
+    dry_run: bool,
+    folder_date: Optional[Tuple[int, int]] = None,
+    printer: Optional[BufferedPrinter] = None,
+) -> bool:
+    """Processes a single file if it matches a supported fix strategy.
+
+    Args:
+        file_path: Path to the file.
+        dry_run: If True, only simulate operations.
+        folder_date: Pre-parsed (year, month) of the containing folder. Parsed
+            from file_path when omitted.
+        printer: Shared output buffer. Lines are printed immediately if omitted.
+
+    Returns:
+        bool: True if the file was fixed, False otherwise.
+    """
     suffix = file_path.suffix.lower()
     writer_config = FIX_WRITERS.get(suffix)
     if not writer_config:
         return False
 
-    year, month = parse_date_from_path(file_path)
-    if not year or not month:
-        return False
-
-    if not (1900 < year < 2030 and 1 <= month <= 12):
+    year, month = folder_date or parse_date_from_path(file_path)
+    if not is_valid_fix_date(year, month):
         return False
 
     metadata_label, value_attr, writer = writer_config
@@ -257,15 +381,55 @@ def process_fix_file(file_path: Path, dry_run: bool) -> bool:
         metadata_label=metadata_label,
         metadata_value=getattr(payload, value_attr),
         writer=writer,
+        is_current=FIX_CHECKERS.get(suffix),
+        printer=printer,
     )
 
 
-def run_fix(config: Dict[str, Any], dry_run: Optional[bool] = None) -> Dict[str, Any]:
+def collect_fix_candidates(target_root: Path) -> List[Tuple[Path, Tuple[int, int]]]:
+    """Collects fixable files together with their folder date.
+
+    The date is parsed once per directory, and directories without a usable
+    date are skipped without looking at their files.
+    """
+    candidates = []
+
+    for dirpath, _dirnames, filenames in os.walk(target_root):
+        year, month = parse_date_from_dirpath(dirpath)
+        if not is_valid_fix_date(year, month):
+            continue
+
+        for name in filenames:
+            # Filter on the bare name so unsupported files never become Paths
+            dot = name.rfind(".")
+            if dot <= 0 or name[dot:].lower() not in FIX_EXTENSIONS:
+                continue
+            candidates.append((Path(dirpath) / name, (year, month)))
+
+    return candidates
+
+
+def resolve_fix_workers(config: Dict[str, Any]) -> int:
+    """Returns the number of parallel fix writers.
+
+    Uses settings.fix_workers when set. Otherwise defaults to an I/O-bound pool
+    size of min(32, CPU count * 4).
+    """
+    workers = config.get("settings", {}).get("fix_workers")
+    if workers:
+        return max(1, int(workers))
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+def run_fix(
+    config: Dict[str, Any], dry_run: Optional[bool] = None, verbose: bool = False
+) -> Dict[str, Any]:
     """Runs the metadata fix process.
 
     Args:
         config: Configuration dictionary.
         dry_run: If True, only simulate operations. Defaults to config setting.
+        verbose: If True, print each log line as it happens instead of batching.
 
     Returns:
         Dict[str, Any]: Statistics including "success" and "failed".
@@ -282,14 +446,21 @@ def run_fix(config: Dict[str, Any], dry_run: Optional[bool] = None) -> Dict[str,
         print(f"❌ Directory not found: {target_root}")
         return {"success": 0, "failed": 0}
 
-    count = 0
-
-    for file_path in target_root.rglob("*"):
-        if not file_path.is_file():
-            continue
-
-        if process_fix_file(file_path, dry_run):
-            count += 1
+    candidates = collect_fix_candidates(target_root)
+
+    # Writes are dominated by disk I/O, so overlapping them hides per-file latency
+    with (
+        BufferedPrinter(immediate=verbose) as printer,
+        ThreadPoolExecutor(max_workers=resolve_fix_workers(config)) as executor,
+    ):
+        count = sum(
+            executor.map(
+                lambda candidate: process_fix_file(
+                    candidate[0], dry_run, folder_date=candidate[1], printer=printer
+                ),
+                candidates,
+            )
+        )
 
     print("-" * 40)
     print(f"🏁 Done. Processed: {count} files")
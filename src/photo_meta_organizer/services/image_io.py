@@ -1,5 +1,63 @@
 """Shared image I/O helpers."""
 
+import importlib
+import io
+import os
+import struct
+import sys
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple
+
+from PIL import Image
+
+# EXIF tags holding capture dates: DateTime (IFD0), DateTimeOriginal and
+# DateTimeDigitized (Exif IFD)
+EXIF_DATETIME = 306
+EXIF_DATETIME_ORIGINAL = 36867
+EXIF_DATETIME_DIGITIZED = 36868
+EXIF_IFD_POINTER = 0x8769
+
+JPEG_EXTENSIONS = frozenset({".jpg", ".jpeg"})
+
+# Major brands of the ISO-BMFF (HEIF/AVIF) files pillow-heif can open
+HEIF_BRANDS = frozenset(
+    {b"heic", b"heix", b"hevc", b"hevx", b"heim", b"heis", b"mif1", b"msf1", b"avif"}
+)
+
+
+class LazyModule:
+    """Module proxy that imports the real module on first attribute access.
+
+    Loading goes through the regular import machinery and its locks, so the
+    first access may safely happen from several worker threads at once.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    def __getattr__(self, attr: str) -> Any:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+def lazy_import(name: str) -> Any:
+    """Returns a module whose import is deferred until first attribute access.
+
+    Args:
+        name: Fully qualified module name.
+
+    Returns:
+        Any: The already-imported module, or a LazyModule proxy for it.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
+
 
 def register_heif_support() -> None:
     """Registers the Pillow HEIF opener when the dependency is available."""
@@ -9,3 +67,269 @@ def register_heif_support() -> None:
         return
 
     register_heif_opener()
+
+
+def get_exif_date_string(exif: Any) -> Optional[str]:
+    """Returns the capture date string from a Pillow Exif mapping.
+
+    Image.getexif() only exposes IFD0, while DateTimeOriginal lives in the Exif
+    sub-IFD. get_ifd() parses that IFD from the already-read EXIF block, so no
+    pixel data is loaded.
+
+    Args:
+        exif: The result of Image.getexif().
+
+    Returns:
+        Optional[str]: DateTimeOriginal, falling back to DateTime, or None.
+    """
+    original = exif.get_ifd(EXIF_IFD_POINTER).get(EXIF_DATETIME_ORIGINAL)
+    return original or exif.get(EXIF_DATETIME)
+
+
+def parse_exif_datetime(value: str) -> datetime:
+    """Parses an EXIF "YYYY:MM:DD HH:MM:SS" date string.
+
+    The fixed layout is sliced directly; datetime.strptime is only used for
+    strings that do not match it.
+
+    Args:
+        value: The EXIF date string.
+
+    Returns:
+        datetime: The parsed date.
+
+    Raises:
+        ValueError: If the string is not a valid EXIF date.
+    """
+    if (
+        len(value) == 19
+        and value[4] == ":"
+        and value[7] == ":"
+        and value[10] == " "
+        and value[13] == ":"
+        and value[16] == ":"
+    ):
+        return datetime(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+        )
+    return datetime.strptime(value, "%Y:%m:%d %H:%M:%S")
+
+
+def has_exif_container_signature(path: Path) -> bool:
+    """Checks the leading bytes for a format Pillow can read EXIF from.
+
+    Recognizes JPEG, TIFF (including TIFF-based raw formats), PNG, WebP and
+    HEIF/AVIF. Anything else (videos, BMP, CR3, mislabeled files) cannot yield
+    an EXIF date, so callers can skip Image.open altogether.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        bool: True if the file starts with a known EXIF-capable signature.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(12)
+    except OSError:
+        return False
+
+    if head.startswith((b"\xff\xd8\xff", b"II*\x00", b"MM\x00*", b"\x89PNG")):
+        return True
+    if head.startswith(b"RIFF") and head[8:12] == b"WEBP":
+        return True
+    return head[4:8] == b"ftyp" and head[8:12] in HEIF_BRANDS
+
+
+def _iter_ifd_entries(
+    tiff: bytes, offset: int, endian: str
+) -> Iterator[Tuple[int, int, int, bytes]]:
+    """Yields (tag, type, count, raw value field) for each entry of an IFD."""
+    (count,) = struct.unpack_from(endian + "H", tiff, offset)
+    for index in range(count):
+        entry = offset + 2 + index * 12
+        tag, value_type, value_count = struct.unpack_from(endian + "HHI", tiff, entry)
+        yield tag, value_type, value_count, tiff[entry + 8 : entry + 12]
+
+
+def _read_ascii_value(tiff: bytes, endian: str, count: int, field: bytes) -> str:
+    """Decodes an ASCII entry, which is stored inline when it fits in 4 bytes."""
+    if count <= 4:
+        raw = field[:count]
+    else:
+        (value_offset,) = struct.unpack(endian + "I", field)
+        raw = tiff[value_offset : value_offset + count]
+    return raw.rstrip(b"\x00").decode("ascii", errors="replace")
+
+
+def _parse_tiff_dates(tiff: bytes) -> Optional[Dict[int, str]]:
+    """Extracts the date tags from a TIFF-structured EXIF payload."""
+    if tiff[:2] == b"II":
+        endian = "<"
+    elif tiff[:2] == b"MM":
+        endian = ">"
+    else:
+        return None
+
+    magic, ifd0_offset = struct.unpack_from(endian + "HI", tiff, 2)
+    if magic != 42:
+        return None
+
+    dates = {}
+    exif_ifd_offset = None
+    for tag, value_type, count, field in _iter_ifd_entries(tiff, ifd0_offset, endian):
+        if tag == EXIF_DATETIME and value_type == 2:
+            dates[tag] = _read_ascii_value(tiff, endian, count, field)
+        elif tag == EXIF_IFD_POINTER:
+            (exif_ifd_offset,) = struct.unpack(endian + "I", field)
+
+    if exif_ifd_offset:
+        for tag, value_type, count, field in _iter_ifd_entries(
+            tiff, exif_ifd_offset, endian
+        ):
+            if value_type == 2 and tag in (
+                EXIF_DATETIME_ORIGINAL,
+                EXIF_DATETIME_DIGITIZED,
+            ):
+                dates[tag] = _read_ascii_value(tiff, endian, count, field)
+
+    return dates
+
+
+def _read_jpeg_exif_dates(f: BinaryIO) -> Optional[Dict[int, str]]:
+    """Walks the JPEG markers of an open file up to the EXIF segment.
+
+    Only segment headers and the EXIF segment itself are read; every other
+    segment is skipped with a relative seek.
+    """
+    if f.read(2) != b"\xff\xd8":
+        return None
+
+    try:
+        while True:
+            if f.read(1) != b"\xff":
+                return None
+            marker = f.read(1)
+            while marker == b"\xff":
+                # Fill bytes before the actual marker
+                marker = f.read(1)
+            if not marker:
+                return None
+            if marker in (b"\xd9", b"\xda"):
+                # End of image / start of scan: no EXIF segment precedes the data
+                return {}
+
+            (length,) = struct.unpack(">H", f.read(2))
+            if length < 2:
+                return None
+            if marker == b"\xe1":
+                segment = f.read(length - 2)
+                if len(segment) < length - 2:
+                    return None
+                if segment.startswith(b"Exif\x00\x00"):
+                    return _parse_tiff_dates(segment[6:])
+                # Another APP1 payload (e.g. XMP): keep looking
+                continue
+            f.seek(length - 2, io.SEEK_CUR)
+    except (struct.error, IndexError):
+        return None
+
+
+def parse_jpeg_exif_dates(data: bytes) -> Optional[Dict[int, str]]:
+    """Finds the EXIF date tags in the leading bytes of a JPEG file.
+
+    Args:
+        data: The beginning of the file, up to and including the EXIF segment.
+
+    Returns:
+        Optional[Dict[int, str]]: Date strings keyed by EXIF tag id ({} when the
+        JPEG has no EXIF dates), or None when the data is not a JPEG or could not
+        be parsed and callers should fall back to a full EXIF reader.
+    """
+    return _read_jpeg_exif_dates(io.BytesIO(data))
+
+
+def read_jpeg_exif_dates(path: Path) -> Optional[Dict[int, str]]:
+    """Reads the EXIF date tags of a JPEG without decoding the whole EXIF block.
+
+    Only the marker headers before the EXIF segment and the segment itself are
+    read, typically a few KB, wherever the segment sits in the header.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Optional[Dict[int, str]]: See parse_jpeg_exif_dates. Also None when the
+        file cannot be read.
+    """
+    try:
+        with open(path, "rb") as f:
+            return _read_jpeg_exif_dates(f)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def read_jpeg_exif_dates_cached(path: str, mtime_ns: int) -> Optional[Dict[int, str]]:
+    """Cached variant of read_jpeg_exif_dates.
+
+    mtime_ns only takes part in the cache key, so a file rewritten in between
+    calls is parsed again. The returned dict is shared and must not be modified.
+
+    Args:
+        path: Path to the file.
+        mtime_ns: Modification time of the file in nanoseconds.
+
+    Returns:
+        Optional[Dict[int, str]]: See parse_jpeg_exif_dates.
+    """
+    return read_jpeg_exif_dates(Path(path))
+
+
+def read_capture_date(
+    path: Path, suffix: str, stat_result: os.stat_result
+) -> Optional[datetime]:
+    """Reads the EXIF capture date of an image file.
+
+    JPEGs go through the cached segment parser. Other files are only opened
+    with Pillow when their leading bytes belong to a format that can carry
+    EXIF.
+
+    Args:
+        path: Path to the file.
+        suffix: Lowercased extension of the file (see file_io.split_extension).
+        stat_result: Stat of the file; its mtime keys the JPEG cache.
+
+    Returns:
+        Optional[datetime]: DateTimeOriginal, else DateTime, or None when the
+        file has no readable capture date.
+    """
+    date_str = None
+    dates = None
+    if suffix in JPEG_EXTENSIONS:
+        # Parse the EXIF segment directly instead of a full PIL header walk
+        dates = read_jpeg_exif_dates_cached(str(path), stat_result.st_mtime_ns)
+    if dates is not None:
+        date_str = dates.get(EXIF_DATETIME_ORIGINAL) or dates.get(EXIF_DATETIME)
+    elif has_exif_container_signature(path):
+        # Only formats that can carry EXIF are worth a PIL open
+        try:
+            with Image.open(path) as img:
+                exif_data = img.getexif()
+                if exif_data:
+                    date_str = get_exif_date_string(exif_data)
+        except Exception:
+            pass
+
+    if not date_str:
+        return None
+    try:
+        # Format is typically YYYY:MM:DD HH:MM:SS
+        return parse_exif_datetime(date_str)
+    except ValueError:
+        return None
@@ -1,19 +1,37 @@
-import shutil
+import os
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set
 
+from photo_meta_organizer.services.file_io import move_file, scan_file_entries_parallel
+from photo_meta_organizer.services.output import BufferedPrinter
 
-def get_file_size_mb(file_path: Path) -> float:
-    """Calculates file size in MB.
+
+def reserve_junk_name(file_path: Path, junk_names: Set[str]) -> str:
+    """Picks a name in the junk folder that no other file uses and reserves it.
+
+    Names are compared case-folded so that case-insensitive file systems (the
+    macOS default) never get an existing junk file overwritten.
 
     Args:
-        file_path: Path to the file.
+        file_path: File about to be moved into the junk folder.
+        junk_names: Case-folded names already present or reserved in the junk
+            folder.
 
     Returns:
-        float: File size in megabytes.
+        str: The original name, or a timestamped variant on collision.
     """
-    return file_path.stat().st_size / (1024 * 1024)
+    name = file_path.name
+    if name.casefold() in junk_names:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
+        counter = 1
+        while name.casefold() in junk_names:
+            name = f"{file_path.stem}_{timestamp}_{counter}{file_path.suffix}"
+            counter += 1
+
+    junk_names.add(name.casefold())
+    return name
 
 
 def clean_small_files_recursive(
@@ -46,49 +64,64 @@ def clean_small_files_recursive(
     found_count = 0
     scanned_count = 0
 
-    # Recursive scan using rglob('*')
-    for file_path in root_path.rglob("*"):
-        # Skip directory themselves
-        if not file_path.is_file():
-            continue
-
-        # [Safety Lock]: Never scan the junk directory itself
-        if junk_path in file_path.parents:
-            continue
-
-        scanned_count += 1
-        size_mb = get_file_size_mb(file_path)
+    # Collisions are resolved in memory instead of one exists() call per file
+    junk_names = (
+        {name.casefold() for name in os.listdir(junk_path)}
+        if junk_path.is_dir()
+        else set()
+    )
+
+    # Sizes are compared as integers so large files never need a float or a Path
+    threshold_bytes = int(size_threshold_mb * 1024 * 1024)
+
+    # Per-file lines are batched; verbose runs print as they go
+    with BufferedPrinter(immediate=verbose) as printer:
+        # [Safety Lock]: The scanner never descends into the junk directory itself
+        entries = scan_file_entries_parallel(
+            root_path, exclude=junk_path, follow_symlinks=False
+        )
+        entries.sort(key=lambda entry: entry.path)
+        for entry in entries:
+            path_str = entry.path
+            # The stat was cached while listing, so this is not a syscall
+            size_bytes = entry.stat(follow_symlinks=False).st_size
+            scanned_count += 1
+
+            # Verbose logging
+            if verbose:
+                printer.print(
+                    f"[Scanning] {os.path.basename(path_str)} - "
+                    f"{size_bytes / (1024 * 1024):.4f} MB"
+                )
 
-        # Verbose logging
-        if verbose:
-            print(f"[Scanning] {file_path.name} - {size_mb:.4f} MB")
+            # Check size (less than or equal)
+            if size_bytes > threshold_bytes:
+                continue
 
-        # Check size (less than or equal)
-        if size_mb <= size_threshold_mb:
             found_count += 1
+            file_path = Path(path_str)
+            size_mb = size_bytes / (1024 * 1024)
 
-            # Calculate target path
-            target_junk_file = junk_path / file_path.name
-
-            # Handle duplicates
-            if target_junk_file.exists():
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                target_junk_file = (
-                    junk_path / f"{file_path.stem}_{timestamp}{file_path.suffix}"
-                )
+            # Calculate target path (duplicates get a timestamped name)
+            target_junk_file = junk_path / reserve_junk_name(file_path, junk_names)
 
             # Execute/Simulate
             if dry_run:
-                print(f"✅ [Found] {file_path.name}")
-                print(f"   └─ Path: {file_path}")
-                print(f"   └─ Size: {size_mb:.4f} MB (To be moved)")
+                printer.print(
+                    f"✅ [Found] {file_path.name}",
+                    f"   └─ Path: {file_path}",
+                    f"   └─ Size: {size_mb:.4f} MB (To be moved)",
+                )
             else:
                 try:
                     junk_path.mkdir(parents=True, exist_ok=True)
-                    shutil.move(str(file_path), str(target_junk_file))
-                    print(f"🚀 [Moved] {file_path.name}")
+                    move_file(str(file_path), str(target_junk_file))
+                    printer.print(f"🚀 [Moved] {file_path.name}")
                 except Exception as e:
-                    print(f"❌ [Failed] Could not move {file_path.name}: {e}")
+                    printer.print(
+                        f"❌ [Failed] Could not move {file_path.name}: {e}",
+                        flush=True,
+                    )
 
     print("\n--- Summary ---")
     print(f"Scanned: {scanned_count} files")
@@ -1,17 +1,39 @@
 import os
-import shutil
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, Set, Tuple, List
-from PIL import Image
-
-from photo_meta_organizer.services.image_io import register_heif_support
+from typing import Dict, Any, FrozenSet, NamedTuple, Optional, Set, Tuple, List
+
+from photo_meta_organizer.services.file_io import (
+    FolderIndexes,
+    is_same_file,
+    move_file,
+    scan_file_entries,
+    split_extension,
+)
+from photo_meta_organizer.services.image_io import (
+    read_capture_date,
+    register_heif_support,
+)
+from photo_meta_organizer.services.output import BufferedPrinter
 
 
 register_heif_support()
 
+LOCATION_CHARS_PATTERN = re.compile(r"[\u4e00-\u9fa5]+")
+
+
+class OrganizeCandidate(NamedTuple):
+    """A file to organize, with the data derived while scanning its folder."""
+
+    path: Path
+    stat_result: os.stat_result
+    location_suffix: str
 
+
+@lru_cache(maxsize=4096)
 def extract_location_info(folder_name: str) -> str:
     """Extracts Chinese characters from the folder name to determine location.
 
@@ -21,11 +43,33 @@ def extract_location_info(folder_name: str) -> str:
     Returns:
         str: A string containing merged Chinese characters found, or empty string.
     """
-    matches = re.findall(r"[\u4e00-\u9fa5]+", folder_name)
-    return "".join(matches) if matches else ""
+    # Cached: every file of a folder asks for the same folder names
+    return "".join(LOCATION_CHARS_PATTERN.findall(folder_name))
+
+
+def get_location_suffix(dir_path: str) -> str:
+    """Builds the target folder suffix for files in a source directory.
 
+    The location comes from the directory name, or from its parent when the
+    directory name has none.
+
+    Args:
+        dir_path: The directory containing the file.
+
+    Returns:
+        str: " <location>", or empty string when no location is found.
+    """
+    loc = extract_location_info(os.path.basename(dir_path)) or extract_location_info(
+        os.path.basename(os.path.dirname(dir_path))
+    )
+    return f" {loc}" if loc else ""
 
-def get_date_taken(path: Path, image_extensions: Set[str]) -> datetime:
+
+def get_date_taken(
+    path: Path,
+    image_extensions: Set[str],
+    stat_result: Optional[os.stat_result] = None,
+) -> datetime:
     """Gets the creation date of the file.
 
     Tries to read EXIF data for images. Falls back to file modification time.
@@ -33,46 +77,47 @@ def get_date_taken(path: Path, image_extensions: Set[str]) -> datetime:
     Args:
         path: Path to the file.
         image_extensions: Set of extensions considered as images.
+        stat_result: Stat of the file from the directory scan, if available.
+            Saves a stat call; it also keys the JPEG EXIF cache.
 
     Returns:
         datetime: The datetime object representing when the file was taken/created.
     """
-    is_image = path.suffix.lower() in image_extensions
-    if is_image:
-        try:
-            with Image.open(path) as img:
-                exif_data = img.getexif()
-                if exif_data:
-                    date_str = exif_data.get(36867) or exif_data.get(306)
-                    if date_str:
-                        return datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
-        except Exception:
-            pass
-    return datetime.fromtimestamp(os.path.getmtime(path))
+    if stat_result is None:
+        stat_result = os.stat(path)
+    suffix = split_extension(path.name)
+    if suffix in image_extensions:
+        date_obj = read_capture_date(path, suffix, stat_result)
+        if date_obj:
+            return date_obj
+    return datetime.fromtimestamp(stat_result.st_mtime)
+
 
+@lru_cache(maxsize=4096)
+def get_target_folder(
+    target_dir: Path, year: int, month: int, location_suffix: str
+) -> Path:
+    """Builds the destination folder for a year, month and location.
 
-def get_unique_path(path: Path) -> Path:
-    """Generates a unique path by appending a counter if the file exists.
+    Decade / Year / Year-Month [Location]. Cached because every file of the
+    same month and location shares the folder.
 
     Args:
-        path: The original destination path.
+        target_dir: The organize destination root.
+        year: Year the file was taken.
+        month: Month the file was taken.
+        location_suffix: " <location>" or empty string.
 
     Returns:
-        Path: A path that does not currently exist.
+        Path: The target folder.
     """
-    if not path.exists():
-        return path
-    counter = 1
-    while True:
-        new_path = path.parent / f"{path.stem}_{counter}{path.suffix}"
-        if not new_path.exists():
-            return new_path
-        counter += 1
+    decade = "1979-" if year <= 1979 else f"{(year // 10) * 10}+"
+    return target_dir / decade / str(year) / f"{year}-{month:02d}{location_suffix}"
 
 
 def prepare_organize_context(
     config: Dict[str, Any], dry_run: Optional[bool]
-) -> Tuple[Path, Path, Set[str], Set[str], bool]:
+) -> Tuple[Path, Path, FrozenSet[str], FrozenSet[str], bool]:
     """Builds the runtime context for organize."""
     from photo_meta_organizer.config import get_extensions
 
@@ -109,66 +154,146 @@ def build_missing_source_result() -> Dict[str, Any]:
 
 
 def collect_organize_candidates(
-    source_dir: Path, valid_extensions: Set[str], verbose: bool
-) -> Tuple[List[Path], int]:
-    """Collects candidate files and returns initial skip count."""
+    source_dir: Path,
+    valid_extensions: Set[str],
+    verbose: bool,
+    printer: Optional[BufferedPrinter] = None,
+    scan_mode: str = "flat",
+) -> Tuple[List[OrganizeCandidate], int, int]:
+    """Collects candidate files and returns initial skip count.
+
+    Extra hard links of a file that was already collected are skipped, so one
+    inode is never moved twice. Skip messages go to printer, or are printed
+    immediately if it is omitted. scan_mode selects how the source is walked
+    (see file_io.scan_file_entries); the whole tree is collected before any
+    file is moved.
+
+    Returns:
+        Tuple[List[OrganizeCandidate], int, int]: The candidates, the number of
+        skipped files, and how many of those were duplicate hard links.
+    """
+    printer = printer or BufferedPrinter(immediate=True)
     candidates = []
     skipped = 0
-
-    for file_path in source_dir.rglob("*"):
-        if not file_path.is_file():
+    hardlinks = 0
+    # (device, inode) of collected files with more than one link
+    seen_inodes: Set[Tuple[int, int]] = set()
+    # Location suffix per source directory, shared by all files inside it
+    location_suffixes: Dict[str, str] = {}
+
+    # Checks run on the bare entry name; a Path is only built for candidates
+    for entry in scan_file_entries(source_dir, scan_mode):
+        name = entry.name
+
+        # Hidden and system files (e.g. .DS_Store)
+        if name.startswith("."):
+            if verbose:
+                printer.print(f"🗑️ [Skip] System file: {name}")
+            skipped += 1
             continue
 
-        if file_path.name.startswith(".") or file_path.name == ".DS_Store":
-            if verbose:
-                print(f"🗑️ [Skip] System file: {file_path.name}")
+        if split_extension(name) not in valid_extensions:
+            parent_name = os.path.basename(os.path.dirname(entry.path))
+            printer.print(f"⚠️ [Skip] Unsupported format: {name} ({parent_name})")
             skipped += 1
             continue
 
-        if file_path.suffix.lower() not in valid_extensions:
-            print(
-                f"⚠️ [Skip] Unsupported format: {file_path.name} ({file_path.parent.name})"
-            )
+        try:
+            stat_result = entry.stat()
+        except OSError:
+            # Vanished since the directory was listed
             skipped += 1
             continue
 
-        candidates.append(file_path)
+        if stat_result.st_nlink > 1 and not entry.is_symlink():
+            inode_key = (stat_result.st_dev, stat_result.st_ino)
+            if inode_key in seen_inodes:
+                if verbose:
+                    printer.print(f"🔗 [Skip] Hard link of an earlier file: {name}")
+                hardlinks += 1
+                skipped += 1
+                continue
+            seen_inodes.add(inode_key)
+
+        dir_path = os.path.dirname(entry.path)
+        location_suffix = location_suffixes.get(dir_path)
+        if location_suffix is None:
+            location_suffix = location_suffixes[dir_path] = get_location_suffix(
+                dir_path
+            )
+        candidates.append(
+            OrganizeCandidate(Path(entry.path), stat_result, location_suffix)
+        )
 
-    return candidates, skipped
+    return candidates, skipped, hardlinks
+
+
+def resolve_organize_workers(config: Dict[str, Any]) -> int:
+    """Returns the number of parallel organize workers.
+
+    Uses settings.organize_workers when set. Defaults to 1 (sequential).
+    """
+    workers = config.get("settings", {}).get("organize_workers")
+    if workers:
+        return max(1, int(workers))
+    return 1
 
 
 def run_organize_candidates(
-    candidates: List[Path],
+    candidates: List[OrganizeCandidate],
     target_dir: Path,
     image_extensions: Set[str],
     dry_run: bool,
     verbose: bool,
     initial_skip: int,
+    max_workers: int = 1,
+    printer: Optional[BufferedPrinter] = None,
 ) -> Dict[str, Any]:
-    """Runs organize processing for collected candidate files."""
+    """Runs organize processing for collected candidate files.
+
+    Files are processed on a thread pool of max_workers threads. Collision
+    checks and moves into the same target folder are serialized by the lock of
+    that folder's index. Progress lines go to printer, or are printed
+    immediately if it is omitted; errors are always flushed right away.
+    """
+    printer = printer or BufferedPrinter(immediate=True)
     count_success = 0
     count_skip = initial_skip
     errors = []
-    files_processed_ok = 0
+    folder_indexes = FolderIndexes()
 
-    for file_path in candidates:
+    def process_one(
+        indexed: Tuple[int, OrganizeCandidate],
+    ) -> Tuple[Path, Optional[str], Optional[Exception]]:
+        files_processed_ok, (file_path, stat_result, location_suffix) = indexed
         try:
-            files_processed_ok += 1
             result = process_organize_file(
                 file_path=file_path,
+                stat_result=stat_result,
+                location_suffix=location_suffix,
                 target_dir=target_dir,
                 image_extensions=image_extensions,
                 dry_run=dry_run,
                 verbose=verbose,
                 files_processed_ok=files_processed_ok,
+                folder_indexes=folder_indexes,
+                printer=printer,
             )
-            if result == "in_place":
-                count_skip += 1
-                continue
-            count_success += 1
+            return file_path, result, None
         except Exception as e:
-            error_msg = f"{file_path.name}: {e}"
-            print(f"❌ [Error] {error_msg}")
+            return file_path, None, e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = executor.map(process_one, enumerate(candidates, start=1))
+        for file_path, result, error in outcomes:
+            if error is None:
+                if result == "in_place":
+                    count_skip += 1
+                else:
+                    count_success += 1
+                continue
+            error_msg = f"{file_path.name}: {error}"
+            printer.print(f"❌ [Error] {error_msg}", flush=True)
             errors.append(error_msg)
             count_skip += 1
 
@@ -182,50 +307,65 @@ def process_organize_file(
     dry_run: bool,
     verbose: bool,
     files_processed_ok: int,
+    folder_indexes: Optional[FolderIndexes] = None,
+    stat_result: Optional[os.stat_result] = None,
+    location_suffix: Optional[str] = None,
+    printer: Optional[BufferedPrinter] = None,
 ) -> Optional[str]:
-    """Processes a single file for organize and returns an optional error."""
+    """Processes a single file for organize and returns an optional error.
+
+    Collisions are resolved against an in-memory index of the target folder.
+    Pass a shared folder_indexes when processing many files, so each folder is
+    listed only once and files of the same run see each other's names. Lines
+    are printed immediately if printer is omitted.
+    """
+    printer = printer or BufferedPrinter(immediate=True)
     should_print = (files_processed_ok == 1) or (files_processed_ok % 20 == 0)
 
-    date_obj = get_date_taken(file_path, image_extensions)
-    year_str = str(date_obj.year)
-    month_str = f"{date_obj.month:02d}"
+    date_obj = get_date_taken(file_path, image_extensions, stat_result)
 
-    loc = extract_location_info(file_path.parent.name) or extract_location_info(
-        file_path.parent.parent.name
-    )
-    suffix = f" {loc}" if loc else ""
+    if location_suffix is None:
+        location_suffix = get_location_suffix(os.path.dirname(file_path))
 
-    decade = "1979-" if date_obj.year <= 1979 else f"{(date_obj.year // 10) * 10}+"
-    target_folder = target_dir / decade / year_str / f"{year_str}-{month_str}{suffix}"
+    target_folder = get_target_folder(
+        target_dir, date_obj.year, date_obj.month, location_suffix
+    )
     target_path = target_folder / file_path.name
 
-    if dry_run:
-        final_path = target_path
-        note = ""
-        if final_path.exists():
-            final_path = get_unique_path(final_path)
-            note = " [Rename Required]"
+    if folder_indexes is None:
+        folder_indexes = FolderIndexes()
+    index = folder_indexes.get(target_folder)
 
-        if should_print or verbose:
-            print(
-                f"[Dry Run] ({files_processed_ok}) .../{final_path.parent.name}/{final_path.name}{note}"
-            )
-        return None
+    with index.lock:
+        if dry_run:
+            final_path = index.reserve(file_path.name)
+            note = " [Rename Required]" if final_path != target_path else ""
 
-    target_folder.mkdir(parents=True, exist_ok=True)
+            if should_print or verbose:
+                printer.print(
+                    f"[Dry Run] ({files_processed_ok}) .../{final_path.parent.name}/{final_path.name}{note}"
+                )
+            return None
 
-    if target_path.exists() and file_path.resolve() == target_path.resolve():
-        if verbose:
-            print(f"⏩ [Skip] In Place: {file_path.name}")
-        return "in_place"
+        # One mkdir per target folder, not per file
+        index.ensure_folder()
 
-    if target_path.exists():
-        target_path = get_unique_path(target_path)
+        if file_path.name in index and is_same_file(
+            str(file_path), str(target_path), stat_result
+        ):
+            if verbose:
+                printer.print(f"⏩ [Skip] In Place: {file_path.name}")
+            return "in_place"
 
-    shutil.move(str(file_path), str(target_path))
+        target_path = index.reserve(file_path.name)
+        try:
+            move_file(str(file_path), str(target_path))
+        except Exception:
+            index.release(target_path.name)
+            raise
 
     if should_print or verbose:
-        print(f"✅ [Success] ({files_processed_ok}) {file_path.name}")
+        printer.print(f"✅ [Success] ({files_processed_ok}) {file_path.name}")
 
     return None
 
@@ -243,7 +383,8 @@ def organize(
         verbose: If True, print detailed logs.
 
     Returns:
-        Dict[str, Any]: Statistics including "success", "skipped", and "errors".
+        Dict[str, Any]: Statistics including "success", "skipped", "errors" and
+        "hardlinks" (duplicate hard links counted in "skipped").
     """
     source_dir, target_dir, image_extensions, valid_extensions, dry_run = (
         prepare_organize_context(config, dry_run)
@@ -253,18 +394,29 @@ def organize(
     if not source_dir.exists():
         return build_missing_source_result()
 
-    candidates, initial_skip = collect_organize_candidates(
-        source_dir, valid_extensions, verbose
-    )
-    result = run_organize_candidates(
-        candidates=candidates,
-        target_dir=target_dir,
-        image_extensions=image_extensions,
-        dry_run=dry_run,
-        verbose=verbose,
-        initial_skip=initial_skip,
-    )
+    # Per-file lines are batched; verbose runs print them as they happen
+    with BufferedPrinter(immediate=verbose) as printer:
+        candidates, initial_skip, hardlinks = collect_organize_candidates(
+            source_dir,
+            valid_extensions,
+            verbose,
+            printer=printer,
+            scan_mode=config.get("settings", {}).get("scan_mode", "flat"),
+        )
+        result = run_organize_candidates(
+            candidates=candidates,
+            target_dir=target_dir,
+            image_extensions=image_extensions,
+            dry_run=dry_run,
+            verbose=verbose,
+            initial_skip=initial_skip,
+            max_workers=resolve_organize_workers(config),
+            printer=printer,
+        )
+    result["hardlinks"] = hardlinks
 
     print("-" * 40)
     print(f"🏁 Done. Success: {result['success']}, Skipped/Error: {result['skipped']}")
+    if hardlinks:
+        print(f"🔗 Hard links skipped: {hardlinks}")
     return result
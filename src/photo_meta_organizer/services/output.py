@@ -0,0 +1,56 @@
+"""Buffered console output shared by the services."""
+
+import sys
+import threading
+from typing import List, Optional
+
+
+class BufferedPrinter:
+    """Collects log lines and writes them to stdout in batches.
+
+    Per-file progress lines are cheap to collect but expensive to write one by
+    one, so they are joined and written every `batch_size` lines. The printer is
+    thread-safe, which lets worker pools share a single instance.
+
+    Args:
+        batch_size: Number of buffered lines that triggers a write.
+        immediate: If True, every call is written right away (used for verbose
+            runs where output should appear live).
+    """
+
+    def __init__(self, batch_size: int = 1000, immediate: bool = False) -> None:
+        self.batch_size = batch_size
+        self.immediate = immediate
+        self._lines: List[str] = []
+        self._lock = threading.Lock()
+
+    def print(self, *lines: str, flush: bool = False) -> None:
+        """Queues lines for output.
+
+        Args:
+            *lines: Lines to print, written together without interleaving.
+            flush: If True, write everything buffered so far immediately
+                (used for errors, which should be visible as they happen).
+        """
+        with self._lock:
+            self._lines.extend(lines)
+            if flush or self.immediate or len(self._lines) >= self.batch_size:
+                self._write_locked()
+
+    def flush(self) -> None:
+        """Writes all buffered lines."""
+        with self._lock:
+            self._write_locked()
+
+    def _write_locked(self) -> None:
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
+        sys.stdout.flush()
+
+    def __enter__(self) -> "BufferedPrinter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> Optional[bool]:
+        self.flush()
+        return None
@@ -1,20 +1,31 @@
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, Set, List
-from PIL import Image
-from photo_meta_organizer.services.image_io import register_heif_support
+from typing import Dict, Any, FrozenSet, Optional, Tuple, Set, List
+from photo_meta_organizer.services.file_io import (
+    FolderIndexes,
+    scan_file_entries,
+    split_extension,
+)
+from photo_meta_organizer.services.image_io import (
+    JPEG_EXTENSIONS,
+    read_capture_date,
+    register_heif_support,
+)
 
 register_heif_support()
 
-RENAMED_PREFIX_PATTERN = re.compile(
-    r"^(?P<prefix>\d{8}_\d{6}_(?:sys_)?)?(?P<original>.+)$"
-)
+# Anchored at the start only, so names without a prefix fail on the first char
+RENAMED_PREFIX_PATTERN = re.compile(r"\d{8}_\d{6}_(?P<sys>sys_)?")
 
 
 def get_date_strategy(
-    file_path: Path, image_extensions: Set[str]
+    file_path: Path,
+    image_extensions: Set[str],
+    stat_result: Optional[os.stat_result] = None,
 ) -> Tuple[Optional[datetime], str]:
     """Determines the best date strategy for the file.
 
@@ -26,80 +37,54 @@ def get_date_strategy(
     Args:
         file_path: Path to the file.
         image_extensions: Set of extensions considered as images.
+        stat_result: Stat of the file from the directory scan, if available.
 
     Returns:
         Tuple[Optional[datetime], str]: A tuple containing the datetime object
         (or None if not found) and a source tag string ("" for EXIF, "sys_" for system time).
     """
-    suffix = file_path.suffix.lower()
+    suffix = split_extension(file_path.name)
+
+    if stat_result is None:
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return None, ""
 
     # --- Strategy A: Try reading EXIF for images ---
+    # Empty string indicates official EXIF
     if suffix in image_extensions:
-        try:
-            with Image.open(file_path) as img:
-                exif_data = img.getexif()
-                if exif_data:
-                    # 36867=DateTimeOriginal, 306=DateTime
-                    date_str = exif_data.get(36867) or exif_data.get(306)
-                    if date_str:
-                        # Format is typically YYYY:MM:DD HH:MM:SS
-                        return (
-                            datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S"),
-                            "",
-                        )  # Empty string indicates official EXIF
-        except Exception:
-            pass  # Fallback to next strategy
+        date_obj = read_capture_date(file_path, suffix, stat_result)
+        if date_obj:
+            return date_obj, ""
 
     # --- Strategy B: System modification time (Video or failed EXIF) ---
     # Note: Returns "sys_" tag to indicate it's a guess
     try:
-        mtime = os.path.getmtime(file_path)
-        return datetime.fromtimestamp(mtime), "sys_"
+        return datetime.fromtimestamp(stat_result.st_mtime), "sys_"
     except Exception:
         return None, ""
 
 
-def get_unique_path(path: Path) -> Path:
-    """Generates a unique path by appending a counter if the file exists.
-
-    Format: filename_1.ext, filename_2.ext, etc.
-
-    Args:
-        path: The original destination path.
-
-    Returns:
-        Path: A path that does not currently exist.
-    """
-    if not path.exists():
-        return path
-
-    stem = path.stem
-    suffix = path.suffix
-    parent = path.parent
-    counter = 1
-
-    while True:
-        new_name = f"{stem}_{counter}{suffix}"
-        new_path = parent / new_name
-        if not new_path.exists():
-            return new_path
-        counter += 1
-
-
 def get_original_filename(file_name: str) -> str:
     """Returns the original filename without a generated time prefix."""
     match = RENAMED_PREFIX_PATTERN.match(file_name)
     if not match:
         return file_name
+    if match.end() < len(file_name):
+        return file_name[match.end() :]
+    # The original name is never empty: a bare "YYYYMMDD_HHMMSS_sys_" keeps "sys_"
+    return file_name[match.start("sys") :] if match.group("sys") else file_name
 
-    prefix = match.group("prefix")
-    original = match.group("original")
-    return original if prefix else file_name
+
+def is_rename_candidate(name: str, valid_extensions: Set[str]) -> bool:
+    """Checks a bare file name: not hidden and with a supported extension."""
+    return not name.startswith(".") and split_extension(name) in valid_extensions
 
 
 def prepare_rename_context(
     config: Dict[str, Any], dry_run: Optional[bool]
-) -> Tuple[Path, Set[str], Set[str], bool]:
+) -> Tuple[Path, FrozenSet[str], FrozenSet[str], bool]:
     """Builds the runtime context for rename."""
     from photo_meta_organizer.config import get_extensions
 
@@ -111,35 +96,118 @@ def prepare_rename_context(
     return target_dir, extensions["image"], extensions["all"], resolved_dry_run
 
 
-def collect_rename_candidates(target_dir: Path, valid_extensions: Set[str]) -> List[Path]:
-    """Collects candidate files for rename."""
+def collect_rename_candidates(
+    target_dir: Path, valid_extensions: Set[str], scan_mode: str = "flat"
+) -> List[Tuple[Path, os.stat_result]]:
+    """Collects candidate files for rename together with their stat results.
+
+    scan_mode selects how the directory is walked (see
+    file_io.scan_file_entries).
+    """
     candidates = []
 
-    for file_path in target_dir.rglob("*"):
-        if not file_path.is_file():
+    # Checks run on the bare entry name; a Path is only built for candidates
+    for entry in scan_file_entries(target_dir, scan_mode):
+        if not is_rename_candidate(entry.name, valid_extensions):
             continue
-        if file_path.name.startswith(".") or file_path.name == ".DS_Store":
-            continue
-        if file_path.suffix.lower() not in valid_extensions:
+        try:
+            stat_result = entry.stat()
+        except OSError:
+            # Vanished since the directory was listed
             continue
-        candidates.append(file_path)
+        candidates.append((Path(entry.path), stat_result))
 
     return candidates
 
 
+def resolve_exif_processes(config: Dict[str, Any]) -> int:
+    """Returns the number of processes for reading non-JPEG EXIF dates.
+
+    Uses settings.rename_exif_processes. Defaults to 0, which reads every date
+    in the main process.
+    """
+    processes = config.get("settings", {}).get("rename_exif_processes")
+    return max(0, int(processes)) if processes else 0
+
+
+def read_dates_in_processes(
+    candidates: List[Tuple[Path, os.stat_result]],
+    image_extensions: Set[str],
+    processes: int,
+) -> Dict[Path, Tuple[Optional[datetime], str]]:
+    """Reads the dates of non-JPEG images on a process pool.
+
+    Decoding HEIC headers is CPU-bound and holds the GIL, so it only scales
+    across processes. JPEGs (direct segment parser) and videos (mtime) are
+    cheap and stay in the main process.
+
+    Args:
+        candidates: Collected (path, stat_result) pairs.
+        image_extensions: Set of extensions considered as images.
+        processes: Number of worker processes.
+
+    Returns:
+        Dict[Path, Tuple[Optional[datetime], str]]: get_date_strategy results
+        keyed by path, for the files whose dates were read on the pool. If the
+        pool fails (e.g. a worker crashes in a native decoder), the remaining
+        paths are left out and read in-process by process_rename_file.
+    """
+    pooled = []
+    for file_path, stat_result in candidates:
+        suffix = split_extension(file_path.name)
+        if suffix in image_extensions and suffix not in JPEG_EXTENSIONS:
+            pooled.append((file_path, stat_result))
+    if not pooled:
+        return {}
+
+    paths = [file_path for file_path, _ in pooled]
+    dates: Dict[Path, Tuple[Optional[datetime], str]] = {}
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = pool.map(
+                get_date_strategy,
+                paths,
+                repeat(image_extensions),
+                [stat_result for _, stat_result in pooled],
+                chunksize=32,
+            )
+            for file_path, date_info in zip(paths, results):
+                dates[file_path] = date_info
+    except Exception as e:
+        print(
+            f"⚠️ Warning: EXIF process pool failed, reading "
+            f"{len(paths) - len(dates)} remaining dates in-process: {e}"
+        )
+    return dates
+
+
 def run_rename_candidates(
-    candidates: List[Path], image_extensions: Set[str], dry_run: bool
+    candidates: List[Tuple[Path, os.stat_result]],
+    image_extensions: Set[str],
+    dry_run: bool,
+    exif_processes: int = 0,
 ) -> Dict[str, int]:
-    """Runs rename processing for collected candidate files."""
+    """Runs rename processing for collected candidate files.
+
+    With exif_processes > 0, non-JPEG image dates are read up front on a
+    process pool; renaming itself always happens in this process.
+    """
     count_success = 0
     count_skip = 0
+    folder_indexes = FolderIndexes()
+    dates: Dict[Path, Tuple[Optional[datetime], str]] = {}
+    if exif_processes:
+        dates = read_dates_in_processes(candidates, image_extensions, exif_processes)
 
-    for file_path in candidates:
+    for file_path, stat_result in candidates:
         try:
             renamed, skipped = process_rename_file(
                 file_path=file_path,
+                stat_result=stat_result,
+                date_info=dates.get(file_path),
                 image_extensions=image_extensions,
                 dry_run=dry_run,
+                folder_indexes=folder_indexes,
             )
             if skipped:
                 count_skip += 1
@@ -158,13 +226,22 @@ def process_rename_file(
     file_path: Path,
     image_extensions: Set[str],
     dry_run: bool,
+    folder_indexes: Optional[FolderIndexes] = None,
+    stat_result: Optional[os.stat_result] = None,
+    date_info: Optional[Tuple[Optional[datetime], str]] = None,
 ) -> Tuple[bool, bool]:
     """Processes a single file for rename.
 
+    Collisions are resolved against an in-memory index of the file's folder.
+    Pass a shared folder_indexes when processing many files, so each folder is
+    listed only once. date_info is a precomputed get_date_strategy result.
+
     Returns:
         Tuple[bool, bool]: (renamed, skipped)
     """
-    date_obj, source_tag = get_date_strategy(file_path, image_extensions)
+    if date_info is None:
+        date_info = get_date_strategy(file_path, image_extensions, stat_result)
+    date_obj, source_tag = date_info
     if not date_obj:
         print(f"⚠️ [No Date] Cannot process: {file_path.name}")
         return False, True
@@ -172,20 +249,28 @@ def process_rename_file(
     time_prefix = date_obj.strftime("%Y%m%d_%H%M%S")
     original_name = get_original_filename(file_path.name)
     new_filename = f"{time_prefix}_{source_tag}{original_name}"
-    target_path = file_path.parent / new_filename
 
-    if target_path.name == file_path.name:
+    if new_filename == file_path.name:
         return False, False
 
-    if target_path.exists():
-        target_path = get_unique_path(target_path)
+    if folder_indexes is None:
+        folder_indexes = FolderIndexes()
+    index = folder_indexes.get(file_path.parent)
+    target_path = index.reserve(new_filename)
 
     if dry_run:
         print(f"📝 [Dry Run] {file_path.name}  --->  {target_path.name}")
     else:
-        file_path.rename(target_path)
+        try:
+            file_path.rename(target_path)
+        except Exception:
+            index.release(target_path.name)
+            raise
         print(f"✅ {file_path.name} -> {target_path.name}")
 
+    # The old name is free from now on (simulated in dry run)
+    index.release(file_path.name)
+
     return True, False
 
 
@@ -216,13 +301,19 @@ def rename_process(
         print("❌ Target directory not found")
         return {"success": 0, "skipped": 0}
 
-    candidates = collect_rename_candidates(target_dir, valid_extensions)
-    result = run_rename_candidates(candidates, image_extensions, dry_run)
+    candidates = collect_rename_candidates(
+        target_dir,
+        valid_extensions,
+        config.get("settings", {}).get("scan_mode", "flat"),
+    )
+    result = run_rename_candidates(
+        candidates, image_extensions, dry_run, resolve_exif_processes(config)
+    )
 
     print("-" * 40)
     print(
         f"🏁 Done. Planned rename: {result['success']}, Skipped/Error: {result['skipped']}"
     )
     if dry_run:
-        print("💡 Tip: Set DRY_RUN = False in code or config to execute.")
+        print('💡 Tip: Set "dry_run": false in the params file to execute.')
     return result
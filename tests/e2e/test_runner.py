@@ -126,6 +126,33 @@ class TestPhotoMetaOrganizerE2E(unittest.TestCase):
         self.assertIn("20230520", renamed[0].name)
         self.assertNotEqual(renamed[0].name, "rename_me.jpg")
 
+    def test_batch_tasks(self):
+        photo = SRC_DIR / "batch.jpg"
+        self.create_dummy_file(photo, size_mb=1.0)
+        junk_file = DST_DIR / "tiny.jpg"
+        self.create_dummy_file(junk_file, size_mb=0.1)
+
+        date_time = time.mktime((2023, 5, 20, 10, 0, 0, 0, 0, 0))
+        os.utime(photo, (date_time, date_time))
+
+        params = {
+            "dry_run": False,
+            "tasks": [
+                {"task": "rename", "input_dirs": [str(SRC_DIR)]},
+                {"task": "clean-junk", "input_dirs": [str(DST_DIR)], "threshold": 0.5},
+            ],
+        }
+        with open(PARAMS_FILE, "w") as f:
+            json.dump(params, f)
+
+        res = self.run_cli(["run-task", str(PARAMS_FILE)])
+        self.assertEqual(res.returncode, 0, f"CLI Failed: {res.stderr}")
+
+        renamed = list(SRC_DIR.glob("*.jpg"))
+        self.assertEqual(len(renamed), 1)
+        self.assertIn("20230520", renamed[0].name)
+        self.assertTrue((DST_DIR / "junk" / "tiny.jpg").exists())
+
     def test_fix_video_metadata(self):
         target_dir = SRC_DIR / "2020" / "5"
         target_dir.mkdir(parents=True)
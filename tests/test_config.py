@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from photo_meta_organizer.config import get_extensions, load_config
+
+
+class TestConfig(unittest.TestCase):
+    def test_load_config_uses_json_cache_until_yaml_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            config_file = root / "config.yaml"
+            cache_file = root / "config.yaml.cache.json"
+            config_file.write_text("extensions:\n  image: ['.jpg']\n")
+
+            with patch(
+                "photo_meta_organizer.config.get_project_root", return_value=root
+            ):
+                first = load_config()
+                self.assertTrue(cache_file.exists())
+
+                # A fresh cache is served without touching the YAML parser
+                with patch("yaml.safe_load") as mock_safe_load:
+                    self.assertEqual(load_config(), first)
+                mock_safe_load.assert_not_called()
+
+                cached_mtime_ns = json.loads(cache_file.read_text())["source_mtime_ns"]
+                config_file.write_text("extensions:\n  image: ['.png']\n")
+                os.utime(config_file, ns=(cached_mtime_ns, cached_mtime_ns + 10**9))
+                second = load_config()
+
+        self.assertEqual(first, {"extensions": {"image": [".jpg"]}})
+        self.assertEqual(second, {"extensions": {"image": [".png"]}})
+
+    def test_load_config_detects_edit_with_same_mtime(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            config_file = root / "config.yaml"
+            config_file.write_text("extensions:\n  image: ['.jpg']\n")
+
+            with patch(
+                "photo_meta_organizer.config.get_project_root", return_value=root
+            ):
+                load_config()
+                mtime_ns = config_file.stat().st_mtime_ns
+                config_file.write_text("extensions:\n  image: ['.jpg', '.png']\n")
+                os.utime(config_file, ns=(mtime_ns, mtime_ns))
+                config = load_config()
+
+        self.assertEqual(config, {"extensions": {"image": [".jpg", ".png"]}})
+
+    def test_load_config_skips_cache_for_non_string_keys(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            config_file = root / "config.yaml"
+            config_file.write_text("albums:\n  2023: trip\n")
+
+            with patch(
+                "photo_meta_organizer.config.get_project_root", return_value=root
+            ):
+                first = load_config()
+                second = load_config()
+
+            self.assertFalse((root / "config.yaml.cache.json").exists())
+
+        self.assertEqual(first, {"albums": {2023: "trip"}})
+        self.assertEqual(second, first)
+
+    def test_get_extensions_lowercases_into_frozensets(self):
+        extensions = get_extensions(
+            {"extensions": {"image": [".JPG", ".heic"], "video": [".MOV"]}}
+        )
+
+        self.assertEqual(extensions["image"], frozenset({".jpg", ".heic"}))
+        self.assertEqual(extensions["all"], frozenset({".jpg", ".heic", ".mov"}))
+        self.assertIsInstance(extensions["all"], frozenset)
+
+
+if __name__ == "__main__":
+    unittest.main()
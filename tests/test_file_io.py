@@ -0,0 +1,167 @@
+import errno
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from photo_meta_organizer.services.file_io import (
+    FolderIndex,
+    is_same_file,
+    iter_file_entries,
+    move_file,
+    scan_file_entries,
+    scan_file_entries_parallel,
+    split_extension,
+)
+
+
+class TestFileIo(unittest.TestCase):
+    def test_iter_file_entries_walks_nested_directories(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "2023" / "05").mkdir(parents=True)
+            (root / "a.jpg").write_bytes(b"a")
+            (root / "2023" / "05" / "b.heic").write_bytes(b"b")
+            os.symlink(root / "2023", root / "link_to_2023")
+
+            paths = sorted(entry.path for entry in iter_file_entries(root))
+
+        self.assertEqual(
+            paths, [str(root / "2023" / "05" / "b.heic"), str(root / "a.jpg")]
+        )
+
+    def test_scan_file_entries_progressive_matches_flat(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            for folder in ["2021/01", "2022/05/trip", "2023"]:
+                (root / folder).mkdir(parents=True)
+                (root / folder / "a.jpg").write_bytes(b"a")
+            (root / "b.jpg").write_bytes(b"b")
+
+            flat = sorted(entry.path for entry in scan_file_entries(root, "flat"))
+            progressive = [
+                entry.path for entry in scan_file_entries(root, "progressive")
+            ]
+
+        self.assertEqual(len(flat), 4)
+        self.assertEqual(sorted(progressive), flat)
+        self.assertEqual(progressive[0], str(root / "b.jpg"))
+
+    def test_scan_file_entries_parallel_skips_excluded_dir_and_symlinks(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "a" / "b").mkdir(parents=True)
+            (root / "junk").mkdir()
+            (root / "top.jpg").write_bytes(b"12")
+            (root / "a" / "b" / "deep.jpg").write_bytes(b"1234")
+            (root / "junk" / "old.jpg").write_bytes(b"1")
+            os.symlink(root / "top.jpg", root / "a" / "link.jpg")
+
+            entries = scan_file_entries_parallel(
+                root, max_workers=4, exclude=root / "junk", follow_symlinks=False
+            )
+            files = sorted(
+                (entry.path, entry.stat(follow_symlinks=False).st_size)
+                for entry in entries
+            )
+
+        self.assertEqual(
+            files,
+            [
+                (str(root / "a" / "b" / "deep.jpg"), 4),
+                (str(root / "top.jpg"), 2),
+            ],
+        )
+
+    def test_scan_file_entries_rejects_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            scan_file_entries(Path("."), "deep")
+
+    def test_split_extension_matches_path_suffix(self):
+        for name in ["a.JPG", "a.tar.gz", "noext", ".hidden", "a.", ".a.jpg"]:
+            self.assertEqual(split_extension(name), Path(name).suffix.lower())
+
+    def test_folder_index_reserve_appends_counter(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            folder = Path(temp_dir)
+            (folder / "IMG_0001.JPG").write_bytes(b"a")
+            index = FolderIndex(folder)
+
+            self.assertEqual(index.reserve("img_0001.jpg"), folder / "img_0001_1.jpg")
+            self.assertEqual(index.reserve("img_0001.jpg"), folder / "img_0001_2.jpg")
+            self.assertEqual(index.reserve("other.jpg"), folder / "other.jpg")
+
+    def test_folder_index_release_frees_name(self):
+        index = FolderIndex(Path("/nonexistent/folder"))
+        index.reserve("a.jpg")
+        index.release("a.jpg")
+
+        self.assertNotIn("a.jpg", index)
+        self.assertEqual(index.reserve("a.jpg"), Path("/nonexistent/folder/a.jpg"))
+
+    def test_folder_index_release_keeps_case_variants(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            folder = Path(temp_dir)
+            (folder / "20230101_120000_a.jpg").write_bytes(b"a")
+            (folder / "20230101_120000_A.jpg").write_bytes(b"A")
+            index = FolderIndex(folder)
+
+            index.release("20230101_120000_A.jpg")
+
+            self.assertIn("20230101_120000_a.jpg", index)
+            self.assertEqual(
+                index.reserve("20230101_120000_a.jpg"),
+                folder / "20230101_120000_a_1.jpg",
+            )
+
+            index.release("20230101_120000_a.jpg")
+            index.release("20230101_120000_a_1.jpg")
+            self.assertNotIn("20230101_120000_A.JPG", index)
+
+    def test_folder_index_ensure_folder_creates_once(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            folder = Path(temp_dir) / "2020+" / "2023" / "2023-05"
+            index = FolderIndex(folder)
+            self.assertFalse(index.exists)
+
+            index.ensure_folder()
+            self.assertTrue(folder.is_dir())
+
+            with patch.object(Path, "mkdir") as mock_mkdir:
+                index.ensure_folder()
+            mock_mkdir.assert_not_called()
+
+    def test_is_same_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            folder = Path(temp_dir)
+            photo = folder / "a.jpg"
+            photo.write_bytes(b"photo")
+            (folder / "b.jpg").write_bytes(b"photo")
+            os.symlink(photo, folder / "link.jpg")
+
+            self.assertTrue(is_same_file(str(photo), str(folder / "." / "a.jpg")))
+            self.assertTrue(is_same_file(str(folder / "link.jpg"), str(photo)))
+            self.assertFalse(is_same_file(str(photo), str(folder / "b.jpg")))
+            self.assertFalse(is_same_file(str(photo), str(folder / "missing.jpg")))
+
+    def test_move_file_copies_across_devices(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src = Path(temp_dir) / "a.jpg"
+            dst = Path(temp_dir) / "b.jpg"
+            src.write_bytes(b"photo")
+            os.utime(src, (1684576800, 1684576800))
+
+            with patch(
+                "photo_meta_organizer.services.file_io.os.rename",
+                side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+            ):
+                move_file(str(src), str(dst))
+
+            self.assertFalse(src.exists())
+            self.assertEqual(dst.read_bytes(), b"photo")
+            self.assertEqual(dst.stat().st_mtime, 1684576800)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,8 @@ sys.modules.setdefault("piexif", types.SimpleNamespace())
 from photo_meta_organizer.services.fix_metadata import (
     apply_metadata_fix,
     build_fix_timestamp,
+    parse_date_from_dirpath,
+    parse_date_from_names,
     write_reencoded_image_metadata,
 )
 
@@ -41,6 +43,16 @@ class FakeImage:
 
 
 class TestFixMetadata(unittest.TestCase):
+    def test_parse_date_from_names_strategies(self):
+        self.assertEqual(parse_date_from_names("2023-5 Trip", "photos"), (2023, 5))
+        self.assertEqual(parse_date_from_names("2023", "photos"), (2023, 1))
+        self.assertEqual(parse_date_from_names("2", "2000"), (2000, 2))
+        self.assertEqual(parse_date_from_names("misc", "2000"), (None, None))
+
+    def test_parse_date_from_dirpath_uses_parent_and_grandparent(self):
+        self.assertEqual(parse_date_from_dirpath("/scans/2000/02/"), (2000, 2))
+        self.assertEqual(parse_date_from_dirpath("/scans/1999 12"), (1999, 12))
+
     def test_apply_heic_metadata_fix(self):
         fake_image = FakeImage()
 
@@ -111,6 +123,25 @@ class TestFixMetadata(unittest.TestCase):
         self.assertEqual(fake_image.saved_kwargs["exif"], b"fake-exif")
         mock_utime.assert_called_once()
 
+    def test_apply_metadata_fix_skips_already_fixed_file(self):
+        payload = build_fix_timestamp(2021, 2)
+        written = []
+
+        with patch("photo_meta_organizer.services.fix_metadata.os.utime") as mock_utime:
+            success = apply_metadata_fix(
+                file_path=Path("sample.jpg"),
+                payload=payload,
+                dry_run=False,
+                metadata_label="EXIF Write",
+                metadata_value=payload.exif_value,
+                writer=lambda file_path, payload: written.append(file_path),
+                is_current=lambda file_path, payload: True,
+            )
+
+        self.assertTrue(success)
+        self.assertEqual(written, [])
+        mock_utime.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,159 @@
+import io
+import os
+import struct
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from PIL import Image
+
+from photo_meta_organizer.services.image_io import (
+    get_exif_date_string,
+    has_exif_container_signature,
+    parse_exif_datetime,
+    parse_jpeg_exif_dates,
+    read_capture_date,
+    read_jpeg_exif_dates,
+)
+
+
+def build_jpeg(exif_bytes: bytes = b"") -> bytes:
+    buffer = io.BytesIO()
+    kwargs = {"exif": exif_bytes} if exif_bytes else {}
+    Image.new("RGB", (8, 8)).save(buffer, format="JPEG", **kwargs)
+    return buffer.getvalue()
+
+
+def build_little_endian_exif() -> bytes:
+    date_original = b"2019:03:15 12:00:00\x00"
+    date_time = b"2018:01:02 03:04:05\x00"
+    # IFD0: DateTime + ExifIFD pointer; Exif IFD: DateTimeOriginal
+    ifd0_offset = 8
+    exif_ifd_offset = ifd0_offset + 2 + 2 * 12 + 4
+    data_offset = exif_ifd_offset + 2 + 12 + 4
+    tiff = b"II" + struct.pack("<HI", 42, ifd0_offset)
+    tiff += struct.pack("<H", 2)
+    tiff += struct.pack("<HHII", 306, 2, len(date_time), data_offset)
+    tiff += struct.pack("<HHII", 0x8769, 4, 1, exif_ifd_offset)
+    tiff += struct.pack("<I", 0)
+    tiff += struct.pack("<H", 1)
+    tiff += struct.pack(
+        "<HHII", 36867, 2, len(date_original), data_offset + len(date_time)
+    )
+    tiff += struct.pack("<I", 0)
+    tiff += date_time + date_original
+    return b"Exif\x00\x00" + tiff
+
+
+class TestImageIo(unittest.TestCase):
+    def test_parse_jpeg_exif_dates_reads_little_endian_tags(self):
+        exif = build_little_endian_exif()
+        data = (
+            b"\xff\xd8"
+            + b"\xff\xe1"
+            + struct.pack(">H", len(exif) + 2)
+            + exif
+            + b"\xff\xda\x00\x02"
+        )
+
+        self.assertEqual(
+            parse_jpeg_exif_dates(data),
+            {306: "2018:01:02 03:04:05", 36867: "2019:03:15 12:00:00"},
+        )
+
+    def test_read_jpeg_exif_dates_matches_pillow_written_exif(self):
+        exif = Image.Exif()
+        exif[306] = "2020:05:15 12:00:00"
+        exif.get_ifd(0x8769)[36867] = "2020:05:15 12:00:00"
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "sample.jpg"
+            file_path.write_bytes(build_jpeg(exif.tobytes()))
+            dates = read_jpeg_exif_dates(file_path)
+
+        self.assertEqual(
+            dates, {306: "2020:05:15 12:00:00", 36867: "2020:05:15 12:00:00"}
+        )
+
+    def test_read_jpeg_exif_dates_skips_large_leading_segments(self):
+        exif = build_little_endian_exif()
+        # Two maximum-size APP2 (ICC profile) segments push EXIF past 128 KB
+        padding = (b"\xff\xe2" + struct.pack(">H", 65535) + b"\x00" * 65533) * 2
+        data = (
+            b"\xff\xd8"
+            + padding
+            + b"\xff\xe1"
+            + struct.pack(">H", len(exif) + 2)
+            + exif
+            + b"\xff\xda\x00\x02"
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "sample.jpg"
+            file_path.write_bytes(data)
+            dates = read_jpeg_exif_dates(file_path)
+
+        self.assertEqual(dates[36867], "2019:03:15 12:00:00")
+
+    def test_parse_jpeg_exif_dates_without_exif(self):
+        self.assertEqual(parse_jpeg_exif_dates(build_jpeg()), {})
+
+    def test_parse_jpeg_exif_dates_rejects_non_jpeg(self):
+        self.assertIsNone(parse_jpeg_exif_dates(b"\x89PNG\r\n\x1a\n"))
+
+    def test_get_exif_date_string_reads_exif_sub_ifd(self):
+        data = build_jpeg(build_little_endian_exif())
+        with Image.open(io.BytesIO(data)) as img:
+            self.assertEqual(get_exif_date_string(img.getexif()), "2019:03:15 12:00:00")
+
+    def test_has_exif_container_signature(self):
+        heads = {
+            "photo.jpg": (build_jpeg(), True),
+            "photo.heic": (b"\x00\x00\x00\x18ftypheic\x00\x00\x00\x00", True),
+            "photo.tiff": (b"II*\x00\x08\x00\x00\x00", True),
+            "clip.jpg": (b"\x00\x00\x00\x18ftypisom\x00\x00\x02\x00", False),
+            "image.bmp": (b"BM" + b"\x00" * 20, False),
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name, (data, expected) in heads.items():
+                path = Path(temp_dir) / name
+                path.write_bytes(data)
+                self.assertEqual(has_exif_container_signature(path), expected, name)
+
+            self.assertFalse(has_exif_container_signature(Path(temp_dir) / "missing"))
+
+    def test_parse_exif_datetime(self):
+        self.assertEqual(
+            parse_exif_datetime("2023:05:20 10:00:01"), datetime(2023, 5, 20, 10, 0, 1)
+        )
+        # Non-standard layouts still go through strptime
+        self.assertEqual(
+            parse_exif_datetime("2023:5:20 10:00:01"), datetime(2023, 5, 20, 10, 0, 1)
+        )
+        for value in ["0000:00:00 00:00:00", "2023-05-20 10:00:01", ""]:
+            with self.assertRaises(ValueError):
+                parse_exif_datetime(value)
+
+    def test_read_capture_date(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            photo = Path(temp_dir) / "photo.jpg"
+            photo.write_bytes(build_jpeg(build_little_endian_exif()))
+            png = Path(temp_dir) / "photo.png"
+            Image.new("RGB", (8, 8)).save(png)
+            clip = Path(temp_dir) / "clip.heic"
+            clip.write_bytes(b"\x00\x00\x00\x18ftypisom\x00\x00\x02\x00")
+
+            self.assertEqual(
+                read_capture_date(photo, ".jpg", os.stat(photo)),
+                datetime(2019, 3, 15, 12, 0, 0),
+            )
+            self.assertIsNone(read_capture_date(png, ".png", os.stat(png)))
+            with patch.object(Image, "open") as image_open:
+                self.assertIsNone(read_capture_date(clip, ".heic", os.stat(clip)))
+            image_open.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+from pathlib import Path
+
+from photo_meta_organizer.services.junk_finder import reserve_junk_name
+
+
+class TestJunkFinder(unittest.TestCase):
+    def test_reserve_junk_name_avoids_known_names(self):
+        junk_names = {"thumbs.db"}
+
+        first = reserve_junk_name(Path("a/thumbs.db"), junk_names)
+        second = reserve_junk_name(Path("b/thumbs.db"), junk_names)
+
+        self.assertNotEqual(first, "thumbs.db")
+        self.assertNotEqual(first, second)
+        self.assertTrue(first.startswith("thumbs_") and first.endswith(".db"))
+        self.assertEqual(junk_names, {"thumbs.db", first, second})
+
+    def test_reserve_junk_name_ignores_case(self):
+        junk_names = {"thumbs.db"}
+
+        first = reserve_junk_name(Path("a/Thumbs.db"), junk_names)
+        second = reserve_junk_name(Path("b/THUMBS.DB"), junk_names)
+
+        self.assertNotEqual(first.casefold(), "thumbs.db")
+        self.assertNotEqual(first.casefold(), second.casefold())
+        self.assertEqual(len(junk_names), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,32 @@
+import io
+import os
+import tempfile
 import unittest
+from contextlib import redirect_stdout
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
-from photo_meta_organizer.services.organize_photos import get_date_taken
+from photo_meta_organizer.services.organize_photos import (
+    OrganizeCandidate,
+    collect_organize_candidates,
+    extract_location_info,
+    get_date_taken,
+    get_target_folder,
+    run_organize_candidates,
+)
+
+# Leading bytes of an ISO-BMFF file with the "heic" major brand
+HEIC_HEADER = b"\x00\x00\x00\x18ftypheic"
+
+
+class FakeExif(dict):
+    def __init__(self, tags, exif_ifd=None):
+        super().__init__(tags)
+        self._exif_ifd = exif_ifd or {}
+
+    def get_ifd(self, tag):
+        return self._exif_ifd if tag == 0x8769 else {}
 
 
 class FakeImage:
@@ -22,27 +45,97 @@ class FakeImage:
 
 class TestOrganizePhotos(unittest.TestCase):
     def test_get_date_taken_reads_datetime_original(self):
-        file_path = Path("sample.heic")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "sample.heic"
+            file_path.write_bytes(HEIC_HEADER)
 
-        with patch(
-            "photo_meta_organizer.services.organize_photos.Image.open",
-            return_value=FakeImage({36867: "2023:05:20 10:00:00"}),
-        ):
-            date_taken = get_date_taken(file_path, {".heic"})
+            with patch(
+                "photo_meta_organizer.services.image_io.Image.open",
+                return_value=FakeImage(
+                    FakeExif(
+                        {306: "2024:01:01 00:00:00"},
+                        exif_ifd={36867: "2023:05:20 10:00:00"},
+                    )
+                ),
+            ):
+                date_taken = get_date_taken(file_path, {".heic"})
 
         self.assertEqual(date_taken, datetime(2023, 5, 20, 10, 0, 0))
 
     def test_get_date_taken_reads_datetime_fallback(self):
-        file_path = Path("sample.heic")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "sample.heic"
+            file_path.write_bytes(HEIC_HEADER)
 
-        with patch(
-            "photo_meta_organizer.services.organize_photos.Image.open",
-            return_value=FakeImage({306: "2023:05:20 10:00:00"}),
-        ):
-            date_taken = get_date_taken(file_path, {".heic"})
+            with patch(
+                "photo_meta_organizer.services.image_io.Image.open",
+                return_value=FakeImage(FakeExif({306: "2023:05:20 10:00:00"})),
+            ):
+                date_taken = get_date_taken(file_path, {".heic"})
 
         self.assertEqual(date_taken, datetime(2023, 5, 20, 10, 0, 0))
 
+    def test_extract_location_info_merges_chinese_segments(self):
+        self.assertEqual(extract_location_info("2023-05 北京 trip 长城"), "北京长城")
+        self.assertEqual(extract_location_info("2023-05 trip"), "")
+
+    def test_get_target_folder(self):
+        self.assertEqual(
+            get_target_folder(Path("/dest"), 2023, 5, " 北京"),
+            Path("/dest/2020+/2023/2023-05 北京"),
+        )
+        self.assertEqual(
+            get_target_folder(Path("/dest"), 1978, 12, ""),
+            Path("/dest/1979-/1978/1978-12"),
+        )
+
+    def test_collect_organize_candidates_skips_duplicate_hard_links(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp)
+            (source / "a").mkdir()
+            (source / "b").mkdir()
+            original = source / "a" / "IMG_0001.jpg"
+            original.write_bytes(b"photo")
+            os.link(original, source / "b" / "IMG_0001.jpg")
+            (source / "b" / "IMG_0002.jpg").write_bytes(b"other")
+
+            candidates, skipped, hardlinks = collect_organize_candidates(
+                source, {".jpg"}, verbose=False
+            )
+
+        self.assertEqual(len(candidates), 2)
+        self.assertEqual(skipped, 1)
+        self.assertEqual(hardlinks, 1)
+
+    def test_run_organize_candidates_parallel_resolves_collisions(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "source"
+            target = Path(tmp) / "target"
+            candidates = []
+            for index in range(20):
+                folder = source / f"batch{index}"
+                folder.mkdir(parents=True)
+                file_path = folder / "IMG_0001.mp4"
+                file_path.write_bytes(b"video")
+                os.utime(file_path, (1684576800, 1684576800))
+                candidates.append(OrganizeCandidate(file_path, file_path.stat(), ""))
+
+            with redirect_stdout(io.StringIO()):
+                result = run_organize_candidates(
+                    candidates=candidates,
+                    target_dir=target,
+                    image_extensions=set(),
+                    dry_run=False,
+                    verbose=False,
+                    initial_skip=0,
+                    max_workers=8,
+                )
+
+            month_dir = next(target.glob("2020+/2023/2023-05*"))
+            self.assertEqual(result["success"], 20)
+            self.assertEqual(result["errors"], [])
+            self.assertEqual(len(list(month_dir.iterdir())), 20)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,36 @@
+import io
+import unittest
+from unittest.mock import patch
+
+from photo_meta_organizer.services.output import BufferedPrinter
+
+
+class TestBufferedPrinter(unittest.TestCase):
+    def test_lines_are_written_in_batches(self):
+        stdout = io.StringIO()
+
+        with patch("sys.stdout", stdout):
+            printer = BufferedPrinter(batch_size=3)
+            printer.print("one", "two")
+            self.assertEqual(stdout.getvalue(), "")
+
+            printer.print("three")
+            self.assertEqual(stdout.getvalue(), "one\ntwo\nthree\n")
+
+            printer.print("four")
+            printer.print("error", flush=True)
+
+        self.assertEqual(stdout.getvalue(), "one\ntwo\nthree\nfour\nerror\n")
+
+    def test_context_manager_flushes_remaining_lines(self):
+        stdout = io.StringIO()
+
+        with patch("sys.stdout", stdout):
+            with BufferedPrinter() as printer:
+                printer.print("pending")
+
+        self.assertEqual(stdout.getvalue(), "pending\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
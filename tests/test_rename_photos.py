@@ -1,6 +1,24 @@
+import io
+import tempfile
 import unittest
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
-from photo_meta_organizer.services.rename_photos import get_original_filename
+from PIL import Image
+
+from photo_meta_organizer.services import rename_photos
+from photo_meta_organizer.services.rename_photos import (
+    collect_rename_candidates,
+    get_date_strategy,
+    get_original_filename,
+    is_rename_candidate,
+    read_dates_in_processes,
+    run_rename_candidates,
+)
 
 
 class TestRenamePhotos(unittest.TestCase):
@@ -19,6 +37,125 @@ class TestRenamePhotos(unittest.TestCase):
         file_name = "rename_me.jpg"
         self.assertEqual(get_original_filename(file_name), file_name)
 
+    def test_get_original_filename_keeps_bare_prefix(self):
+        self.assertEqual(get_original_filename("20230520_100000_"), "20230520_100000_")
+
+    def test_get_original_filename_matches_previous_split(self):
+        # Expected values come from the former "(prefix)?(.+)" pattern
+        cases = {
+            "20230101_120000_sys_x.jpg": "x.jpg",
+            "20230101_120000_sys_sys_x.jpg": "sys_x.jpg",
+            "20230101_120000_sys_": "sys_",
+            "20230101_120000_sysx.jpg": "sysx.jpg",
+            "sys_x.jpg": "sys_x.jpg",
+        }
+        for file_name, expected in cases.items():
+            self.assertEqual(get_original_filename(file_name), expected, file_name)
+
+    def test_is_rename_candidate(self):
+        self.assertTrue(is_rename_candidate("IMG_0001.JPG", {".jpg"}))
+        self.assertFalse(is_rename_candidate(".IMG_0001.jpg", {".jpg"}))
+        self.assertFalse(is_rename_candidate("notes.txt", {".jpg"}))
+
+    def test_get_date_strategy_reads_jpeg_exif(self):
+        exif = Image.Exif()
+        exif[306] = "2024:01:01 00:00:00"
+        exif.get_ifd(0x8769)[36867] = "2023:05:20 10:00:00"
+        buffer = io.BytesIO()
+        Image.new("RGB", (8, 8)).save(buffer, format="JPEG", exif=exif)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = Path(tmp) / "photo.jpg"
+            file_path.write_bytes(buffer.getvalue())
+
+            self.assertEqual(
+                get_date_strategy(file_path, {".jpg"}),
+                (datetime(2023, 5, 20, 10, 0, 0), ""),
+            )
+
+    def test_get_date_strategy_falls_back_to_mtime(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = Path(tmp) / "broken.jpg"
+            file_path.write_bytes(b"not a jpeg")
+
+            date_obj, source_tag = get_date_strategy(file_path, {".jpg"})
+
+        self.assertIsNotNone(date_obj)
+        self.assertEqual(source_tag, "sys_")
+
+    def test_get_date_strategy_skips_unreadable_mtime(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = Path(tmp) / "clip.mov"
+            file_path.write_bytes(b"")
+            stat_result = SimpleNamespace(st_mtime=float("nan"), st_mtime_ns=0)
+
+            self.assertEqual(
+                get_date_strategy(file_path, {".jpg"}, stat_result), (None, "")
+            )
+
+    def test_run_rename_candidates_keeps_case_variant_files(self):
+        def write_jpeg(path, date_str):
+            exif = Image.Exif()
+            exif[306] = date_str
+            Image.new("RGB", (8, 8)).save(path, exif=exif)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            write_jpeg(root / "20230101_120000_a.jpg", "2023:01:01 12:00:00")
+            if (root / "20230101_120000_A.jpg").exists():
+                self.skipTest("case-insensitive file system")
+            write_jpeg(root / "20230101_120000_A.jpg", "2023:02:02 12:00:00")
+            write_jpeg(root / "a.jpg", "2023:01:01 12:00:00")
+            original = (root / "20230101_120000_a.jpg").read_bytes()
+            candidates = sorted(collect_rename_candidates(root, {".jpg"}))
+
+            with redirect_stdout(io.StringIO()):
+                run_rename_candidates(candidates, {".jpg"}, dry_run=False)
+
+            self.assertEqual((root / "20230101_120000_a.jpg").read_bytes(), original)
+            self.assertEqual(
+                sorted(path.name for path in root.iterdir()),
+                [
+                    "20230101_120000_a.jpg",
+                    "20230101_120000_a_1.jpg",
+                    "20230202_120000_A.jpg",
+                ],
+            )
+
+    def test_read_dates_in_processes_reads_non_jpeg_images(self):
+        exif = Image.Exif()
+        exif[306] = "2023:05:20 10:00:00"
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            Image.new("RGB", (8, 8)).save(root / "photo.png", exif=exif)
+            Image.new("RGB", (8, 8)).save(root / "photo.jpg", exif=exif)
+            candidates = collect_rename_candidates(root, {".png", ".jpg"})
+
+            dates = read_dates_in_processes(candidates, {".png", ".jpg"}, 2)
+
+        self.assertEqual(
+            dates, {root / "photo.png": (datetime(2023, 5, 20, 10, 0, 0), "")}
+        )
+
+    def test_read_dates_in_processes_falls_back_when_pool_breaks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            Image.new("RGB", (8, 8)).save(root / "photo.png")
+            candidates = collect_rename_candidates(root, {".png"})
+
+            broken_pool = patch.object(
+                rename_photos, "ProcessPoolExecutor", side_effect=BrokenProcessPool
+            )
+            with broken_pool, redirect_stdout(io.StringIO()):
+                dates = read_dates_in_processes(candidates, {".png"}, 2)
+                result = run_rename_candidates(
+                    candidates, {".png"}, dry_run=True, exif_processes=2
+                )
+
+        self.assertEqual(dates, {})
+        self.assertEqual(result, {"success": 1, "skipped": 0})
+
 
 if __name__ == "__main__":
     unittest.main()